@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -11,6 +12,12 @@ from v2m.shared.logging import logger
 from v2m.orchestration.recording_workflow import RecordingWorkflow
 from v2m.orchestration.llm_workflow import LLMWorkflow
 
+# Frames pendientes por cliente websocket antes de empezar a descartar
+WS_SEND_QUEUE_SIZE = 64
+# Tareas en background vivas a partir de las cuales se asume una fuga
+# (lo normal es el warmup más una escritora por cliente websocket)
+BACKGROUND_TASKS_WARN_THRESHOLD = 64
+
 
 class DaemonState:
     """Estado global del daemon (Singleton para la API)."""
@@ -18,7 +25,9 @@ class DaemonState:
     def __init__(self) -> None:
         self._recording_workflow: RecordingWorkflow | None = None
         self._llm_workflow: LLMWorkflow | None = None
-        self._websocket_clients: set[WebSocket] = set()
+        # Cada cliente tiene una cola acotada drenada por su propia tarea escritora:
+        # un cliente lento nunca bloquea al emisor de eventos (el loop de transcripción)
+        self._websocket_clients: dict[WebSocket, asyncio.Queue[str]] = {}
 
     @property
     def recording(self) -> RecordingWorkflow:
@@ -32,21 +41,59 @@ class DaemonState:
             self._llm_workflow = LLMWorkflow()
         return self._llm_workflow
 
+    def add_client(self, websocket: WebSocket) -> asyncio.Task[None]:
+        """Registra un cliente websocket y lanza su tarea escritora.
+
+        Returns:
+            asyncio.Task[None]: Tarea escritora; el llamador la cancela al desconectar.
+        """
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+        self._websocket_clients[websocket] = queue
+        return _track_task(asyncio.create_task(self._client_writer(websocket, queue)))
+
+    def remove_client(self, websocket: WebSocket) -> None:
+        """Desregistra un cliente websocket; no hace nada si ya no estaba."""
+        self._websocket_clients.pop(websocket, None)
+
+    async def _client_writer(self, websocket: WebSocket, queue: asyncio.Queue[str]) -> None:
+        """Envía en orden los frames encolados para un cliente.
+
+        Si el envío falla (cliente desconectado) el cliente se desregistra y
+        la tarea termina; la cancelación se propaga al llamador.
+        """
+        try:
+            while True:
+                payload = await queue.get()
+                await websocket.send_text(payload)
+                queue.task_done()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.remove_client(websocket)
+
     async def broadcast_event(self, event_type: str, data: dict[str, Any]) -> None:
+        """Encola un evento para todos los clientes websocket sin esperar los envíos.
+
+        Args:
+            event_type: Tipo de evento (ej. 'transcription_update', 'heartbeat').
+            data: Payload serializable a JSON.
+        """
         if not self._websocket_clients:
             return
 
-        message = {"event": event_type, "data": data}
-        disconnected: list[WebSocket] = []
-
-        for ws in self._websocket_clients:
-            try:
-                await ws.send_json(message)
-            except Exception:
-                disconnected.append(ws)
+        # Serializar una sola vez (mismo formato que send_json) y encolar sin esperar envíos
+        payload = json.dumps({"event": event_type, "data": data}, separators=(",", ":"), ensure_ascii=False)
+        # Heartbeats y provisionales se reemplazan pronto: con la cola llena se descartan.
+        # Los demás (finales, estados) desalojan el frame más antiguo para entrar.
+        droppable = event_type == "heartbeat" or (event_type == "transcription_update" and not data.get("final"))
 
-        for ws in disconnected:
-            self._websocket_clients.discard(ws)
+        for queue in self._websocket_clients.values():
+            if queue.full():
+                if droppable:
+                    continue
+                queue.get_nowait()
+                queue.task_done()
+            queue.put_nowait(payload)
 
 
 # Singleton
@@ -55,20 +102,42 @@ state = DaemonState()
 _background_tasks: set[asyncio.Task[None]] = set()
 
 
+def _track_task(task: asyncio.Task[None]) -> asyncio.Task[None]:
+    """Retiene una referencia fuerte a `task` hasta que termine.
+
+    Avisa si el conjunto crece por encima del umbral, señal de tareas que no
+    terminan (p. ej. escritoras de clientes nunca canceladas).
+    """
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    if len(_background_tasks) > BACKGROUND_TASKS_WARN_THRESHOLD:
+        logger.warning(f"⚠️ {len(_background_tasks)} tareas en background vivas, posible fuga")
+    return task
+
+
+async def _cancel_background_tasks() -> None:
+    """Cancela las tareas en background pendientes y espera a que terminen."""
+    tasks = list(_background_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Gestión del ciclo de vida de la aplicación."""
     logger.info("🚀 Iniciando V2M API Server (Feature-Based Architecture)...")
 
     # Warmup en background
-    task = asyncio.create_task(state.recording.warmup())
-    _background_tasks.add(task)
-    task.add_done_callback(_background_tasks.discard)
+    _track_task(asyncio.create_task(state.recording.warmup()))
+    _track_task(asyncio.create_task(state.llm.warmup()))
 
     yield
 
     logger.info("🛑 Apagando V2M API Server...")
+    await _cancel_background_tasks()
     await state.recording.shutdown()
+    await state.llm.shutdown()
 
 
 def create_app() -> FastAPI:
@@ -89,14 +158,15 @@ def create_app() -> FastAPI:
     @app.websocket("/ws/events")
     async def websocket_events(websocket: WebSocket):
         await websocket.accept()
-        state._websocket_clients.add(websocket)
+        writer = state.add_client(websocket)
         try:
             while True:
                 await websocket.receive_text()
         except WebSocketDisconnect:
             pass
         finally:
-            state._websocket_clients.discard(websocket)
+            state.remove_client(websocket)
+            writer.cancel()
 
     return app
 
@@ -1,6 +1,6 @@
 """Esquemas de la API (Pydantic V2)."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ToggleResponse(BaseModel):
@@ -12,7 +12,12 @@ class ToggleResponse(BaseModel):
 
 
 class StatusResponse(BaseModel):
-    """Respuesta del endpoint /status."""
+    """Respuesta del endpoint /status.
+
+    Inmutable: el workflow reutiliza una instancia por combinación de estado.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     state: str = Field(description="Estado del daemon: 'idle', 'recording', 'processing'")
     recording: bool = Field(description="True si está grabando actualmente")
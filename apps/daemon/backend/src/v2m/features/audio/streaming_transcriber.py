@@ -41,12 +41,19 @@ logger = logging.getLogger(__name__)
 
 # Constantes de configuración de streaming
 CONTEXT_WINDOW_CHARS = 200  # Ventana deslizante para inyección de prompt
-PROVISIONAL_INTERVAL = 0.5  # Intervalo entre inferencias provisionales (segundos)
+PROVISIONAL_INTERVAL = 0.5  # Audio nuevo (segundos) entre inferencias provisionales
 PRE_ROLL_CHUNKS = 3  # Mantener últimos 3 chunks (~300ms) para no cortar palabras
 MIN_SEGMENT_DURATION = 0.5  # Segundos de habla requeridos para commit
 DEFAULT_SILENCE_COMMIT_MS = 1000  # Duración de silencio por defecto para trigger commit
 CONTEXT_RESET_MS = 3000  # Resetear contexto si silencio excede esto (previene alucinaciones)
 HEARTBEAT_INTERVAL = 2.0  # Intervalo de heartbeat en segundos
+SILERO_FRAME_SAMPLES = 512  # Silero VAD v5 solo acepta frames de 512 muestras a 16kHz
+SEGMENT_BUFFER_SECONDS = 30  # Capacidad inicial del buffer de segmento (crece si se excede)
+DEAD_AIR_RMS = 1e-4  # Por debajo de este RMS el segmento es silencio digital: no se invoca Whisper
+
+# Umbrales en muestras (16kHz): el bucle compara contadores enteros, sin acumular floats
+MIN_SEGMENT_SAMPLES = int(MIN_SEGMENT_DURATION * 16000)
+PROVISIONAL_INTERVAL_SAMPLES = int(PROVISIONAL_INTERVAL * 16000)
 
 
 class StreamingTranscriber:
@@ -76,6 +83,11 @@ class StreamingTranscriber:
         # maxsize=0 significa infinita - el Consumer se pondrá al día
         self._audio_queue: asyncio.Queue[np.ndarray] = asyncio.Queue()
 
+        # Buffer de segmento pre-asignado: el audio se copia una vez al llegar y la
+        # inferencia recibe una vista [:len], sin np.concatenate por cada inferencia
+        self._segment_buffer = np.empty(SEGMENT_BUFFER_SECONDS * 16000, dtype=np.float32)
+        self._segment_len = 0
+
         # Buffer de pre-roll (captura inicio de habla)
         self._pre_roll_buffer: deque[np.ndarray] = deque(maxlen=PRE_ROLL_CHUNKS)
 
@@ -83,10 +95,37 @@ class StreamingTranscriber:
         self._context_window: str = ""
 
         # Parámetros de VAD desde config
-        vad_config = config.transcription.whisper.vad_parameters
+        whisper_config = config.transcription.whisper
+        vad_config = whisper_config.vad_parameters
         self._silence_commit_ms = getattr(vad_config, "min_silence_duration_ms", DEFAULT_SILENCE_COMMIT_MS)
         self._speech_threshold = vad_config.threshold
 
+        # Settings es inmutable (frozen): los kwargs de transcribe se resuelven una sola
+        # vez (incluido vad_parameters.model_dump()); por inferencia solo cambia el prompt
+        common_params = {
+            "language": whisper_config.language if whisper_config.language != "auto" else None,
+            "task": "transcribe",
+            "condition_on_previous_text": False,  # Avoid conflict with manual prompt
+        }
+        self._provisional_params = {
+            **common_params,
+            "beam_size": 1,  # Greedy for speed
+            "best_of": 1,
+            "temperature": 0.0,
+            "vad_filter": True,
+        }
+        self._final_params = {
+            **common_params,
+            "beam_size": whisper_config.beam_size,
+            "best_of": whisper_config.best_of,
+            "temperature": whisper_config.temperature,
+            "vad_filter": whisper_config.vad_filter,
+            "vad_parameters": vad_config.model_dump() if whisper_config.vad_filter else None,
+        }
+
+        # Muestras sobrantes (< 1 frame) que se anteponen al siguiente chunk para Silero
+        self._vad_residual = np.empty(0, dtype=np.float32)
+
         # Rate limiting para errores de VAD
         self._last_vad_error_time = 0.0
 
@@ -97,7 +136,7 @@ class StreamingTranscriber:
                 self._vad_model = load_silero_vad(onnx=True)
                 logger.info("✅ Silero VAD (ONNX) cargado para segmentación de alta precisión")
             except Exception as e:
-                logger.warning(f"⚠️ Error cargando Silero VAD: {e}. Usando fallback de energía.")
+                logger.warning("⚠️ Error cargando Silero VAD: %s. Usando fallback de energía.", e)
         else:
             logger.warning("⚠️ silero-vad no disponible. Usando fallback de energía.")
 
@@ -114,6 +153,11 @@ class StreamingTranscriber:
         self.recorder.start()
         self._stop_event.clear()
         self._context_window = ""
+        # Buffer nuevo por sesión: la inferencia recibe vistas sin copia y un job de
+        # una sesión cancelada puede seguir en el executor leyendo el buffer anterior
+        self._segment_buffer = np.empty(SEGMENT_BUFFER_SECONDS * 16000, dtype=np.float32)
+        self._segment_len = 0
+        self._reset_vad_state()
 
         # Limpiar cola por si hay datos residuales
         while not self._audio_queue.empty():
@@ -151,7 +195,7 @@ class StreamingTranscriber:
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            logger.error(f"Error deteniendo Producer: {e}")
+            logger.error("Error deteniendo Producer: %s", e)
 
         try:
             # Esperar a que Consumer procese cola restante y retorne resultado
@@ -164,7 +208,7 @@ class StreamingTranscriber:
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            logger.error(f"Error deteniendo Consumer: {e}")
+            logger.error("Error deteniendo Consumer: %s", e)
 
         self._producer_task = None
         self._consumer_task = None
@@ -195,7 +239,7 @@ class StreamingTranscriber:
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
-                    logger.error(f"Producer error: {e}")
+                    logger.error("Producer error: %s", e)
                     await asyncio.sleep(0.05)  # Back-off breve en error
 
         except asyncio.CancelledError:
@@ -214,11 +258,11 @@ class StreamingTranscriber:
         la cola crece pero el audio NO se pierde.
         """
         all_final_text: list[str] = []
-        current_segment: list[np.ndarray] = []
-        segment_duration = 0.0
-        last_provisional_time = time.time()
+        # El largo del segmento es self._segment_len (muestras); la duración solo se deriva al loguear
+        last_provisional_samples = 0
         provisional_text = ""
-        silence_start: float | None = None
+        # Reloj de audio: el silencio se mide en muestras recibidas, no en tiempo de pared
+        silence_samples = 0
         last_heartbeat_time = time.time()
 
         try:
@@ -237,9 +281,8 @@ class StreamingTranscriber:
                 if len(chunk) == 0:
                     continue
 
+                # Heartbeat (tiempo de pared: señal de vida para la UI)
                 now = time.time()
-
-                # Heartbeat
                 if now - last_heartbeat_time > HEARTBEAT_INTERVAL:
                     await self.session_manager.emit_event("heartbeat", {"timestamp": now, "state": "recording"})
                     last_heartbeat_time = now
@@ -251,40 +294,34 @@ class StreamingTranscriber:
                 is_speech = self._detect_speech(chunk)
 
                 # Reset de contexto si silencio muy largo (anti-alucinación)
-                if silence_start:
-                    silence_ms = (now - silence_start) * 1000
-                    if silence_ms > CONTEXT_RESET_MS and self._context_window:
-                        self._context_window = ""
+                if silence_samples and silence_samples / 16 > CONTEXT_RESET_MS and self._context_window:
+                    self._context_window = ""
 
                 # Lógica de acumulación de segmentos
-                if is_speech and not current_segment:
+                if is_speech and not self._segment_len:
                     # Inicio de habla - incluir pre-roll buffer
-                    current_segment.extend(self._pre_roll_buffer)
-                    segment_duration = sum(len(c) / 16000 for c in current_segment)
-                    silence_start = None
+                    for pre_roll_chunk in self._pre_roll_buffer:
+                        self._append_to_segment(pre_roll_chunk)
+                    silence_samples = 0
 
                 elif is_speech:
                     # Continuando habla
-                    current_segment.append(chunk)
-                    segment_duration += len(chunk) / 16000
-                    silence_start = None
+                    self._append_to_segment(chunk)
+                    silence_samples = 0
 
-                elif current_segment:
+                elif self._segment_len:
                     # Silencio con segmento activo - seguir acumulando
-                    current_segment.append(chunk)
-                    segment_duration += len(chunk) / 16000
+                    self._append_to_segment(chunk)
+                    silence_samples += len(chunk)
 
-                    if silence_start is None:
-                        silence_start = now
-
-                # Inferencia provisional durante habla
+                # Inferencia provisional durante habla, solo si llegó audio nuevo suficiente
                 if (
                     is_speech
-                    and segment_duration > MIN_SEGMENT_DURATION
-                    and now - last_provisional_time > PROVISIONAL_INTERVAL
+                    and self._segment_len > MIN_SEGMENT_SAMPLES
+                    and self._segment_len - last_provisional_samples > PROVISIONAL_INTERVAL_SAMPLES
                 ):
-                    last_provisional_time = now
-                    text = await self._infer_provisional(current_segment)
+                    last_provisional_samples = self._segment_len
+                    text = await self._infer_provisional(self._segment_audio())
                     if text and text != provisional_text:
                         provisional_text = text
                         await self.session_manager.emit_event(
@@ -293,12 +330,12 @@ class StreamingTranscriber:
                         )
 
                 # COMMIT si silencio > threshold Y tenemos suficiente audio
-                if silence_start and current_segment and segment_duration > MIN_SEGMENT_DURATION:
-                    silence_ms = (now - silence_start) * 1000
+                if silence_samples and self._segment_len > MIN_SEGMENT_SAMPLES:
+                    silence_ms = silence_samples / 16  # 16 muestras por ms a 16kHz
                     if silence_ms > self._silence_commit_ms:
-                        logger.debug(f"Commit segmento: {segment_duration:.2f}s (silencio: {silence_ms:.0f}ms)")
+                        logger.debug("Commit segmento: %.2fs (silencio: %.0fms)", self._segment_len / 16000, silence_ms)
 
-                        final_text = await self._infer_final(current_segment)
+                        final_text = await self._infer_final(self._segment_audio())
                         if final_text:
                             all_final_text.append(final_text)
                             self._update_context_window(final_text)
@@ -308,15 +345,15 @@ class StreamingTranscriber:
                             )
 
                         # FLUSH - limpiar buffers
-                        current_segment.clear()
-                        segment_duration = 0.0
+                        self._segment_len = 0
+                        last_provisional_samples = 0
                         provisional_text = ""
-                        silence_start = None
+                        silence_samples = 0
 
             # Commit final al detener (si queda audio)
-            if current_segment and segment_duration > MIN_SEGMENT_DURATION:
-                logger.debug(f"Commit final al detener: {segment_duration:.2f}s")
-                final_text = await self._infer_final(current_segment)
+            if self._segment_len > MIN_SEGMENT_SAMPLES:
+                logger.debug("Commit final al detener: %.2fs", self._segment_len / 16000)
+                final_text = await self._infer_final(self._segment_audio())
                 if final_text:
                     all_final_text.append(final_text)
                     self._update_context_window(final_text)
@@ -329,9 +366,9 @@ class StreamingTranscriber:
 
         except asyncio.CancelledError:
             # Intentar commit de emergencia
-            if current_segment and segment_duration > MIN_SEGMENT_DURATION:
+            if self._segment_len > MIN_SEGMENT_SAMPLES:
                 try:
-                    final_text = await self._infer_final(current_segment)
+                    final_text = await self._infer_final(self._segment_audio())
                     if final_text:
                         all_final_text.append(final_text)
                 except Exception:
@@ -339,9 +376,23 @@ class StreamingTranscriber:
             return " ".join(all_final_text) if all_final_text else ""
 
         except Exception as e:
-            logger.error(f"Consumer loop error: {e}")
+            logger.error("Consumer loop error: %s", e)
             return " ".join(all_final_text) if all_final_text else ""
 
+    def _append_to_segment(self, chunk: np.ndarray) -> None:
+        """Copia el chunk al buffer de segmento, duplicando la capacidad si se llena."""
+        end = self._segment_len + len(chunk)
+        if end > len(self._segment_buffer):
+            grown = np.empty(max(end, 2 * len(self._segment_buffer)), dtype=np.float32)
+            grown[: self._segment_len] = self._segment_buffer[: self._segment_len]
+            self._segment_buffer = grown
+        self._segment_buffer[self._segment_len : end] = chunk
+        self._segment_len = end
+
+    def _segment_audio(self) -> np.ndarray:
+        """Vista (sin copia) del audio acumulado en el segmento actual."""
+        return self._segment_buffer[: self._segment_len]
+
     # =========================================================================
     # VAD (Voice Activity Detection)
     # =========================================================================
@@ -356,136 +407,148 @@ class StreamingTranscriber:
             return self._detect_speech_silero(chunk)
         return self._detect_speech_energy(chunk)
 
+    def _reset_vad_state(self) -> None:
+        """Reinicia el estado recurrente de Silero y el residuo de framing entre sesiones."""
+        self._vad_residual = np.empty(0, dtype=np.float32)
+        if self._vad_model is not None and hasattr(self._vad_model, "reset_states"):
+            self._vad_model.reset_states()
+
     def _detect_speech_silero(self, chunk: np.ndarray) -> bool:
-        """Detección de habla con Silero VAD (ONNX)."""
+        """Detección de habla con Silero VAD (ONNX).
+
+        Silero v5 exige frames de exactamente 512 muestras, pero el recorder
+        entrega chunks de tamaño arbitrario. El chunk se divide en frames que
+        se evalúan en orden (el estado LSTM persiste entre llamadas) y el
+        sobrante se antepone al siguiente chunk, de modo que el modelo ve un
+        flujo continuo. Hay habla si algún frame supera el umbral.
+        """
         try:
             # Normalizar input
             if chunk.ndim > 1:
                 chunk = chunk.flatten()
 
-            # Mínimo 512 muestras para detección confiable
-            if len(chunk) < 512:
-                return self._detect_speech_energy(chunk)
-
             # Asegurar float32 para ONNX
             if chunk.dtype != np.float32:
                 chunk = chunk.astype(np.float32)
 
-            # Silero requiere tensor torch incluso en modo ONNX
-            chunk_tensor = torch.from_numpy(chunk)
+            if self._vad_residual.size:
+                chunk = np.concatenate((self._vad_residual, chunk))
 
-            speech_prob = self._vad_model(chunk_tensor, 16000)
+            n_frames = len(chunk) // SILERO_FRAME_SAMPLES
+            if n_frames == 0:
+                # Menos de un frame: acumular y decidir por energía mientras tanto
+                self._vad_residual = chunk
+                return self._detect_speech_energy(chunk)
+
+            framed_len = n_frames * SILERO_FRAME_SAMPLES
+            self._vad_residual = chunk[framed_len:]
+
+            # Silero requiere tensor torch incluso en modo ONNX
+            frames = torch.from_numpy(chunk[:framed_len]).reshape(n_frames, SILERO_FRAME_SAMPLES)
 
-            # Manejar retorno tensor o escalar
-            val = speech_prob.item() if hasattr(speech_prob, "item") else float(speech_prob)
+            max_prob = 0.0
+            for frame in frames:
+                speech_prob = self._vad_model(frame, 16000)
+                # Manejar retorno tensor o escalar
+                val = speech_prob.item() if hasattr(speech_prob, "item") else float(speech_prob)
+                max_prob = max(max_prob, val)
 
-            return val > self._speech_threshold
+            return max_prob > self._speech_threshold
 
         except Exception as e:
             now = time.time()
             if now - self._last_vad_error_time > 5.0:
-                logger.warning(f"Silero VAD error: {e} (throttled)")
+                logger.warning("Silero VAD error: %s (throttled)", e)
                 self._last_vad_error_time = now
             return self._detect_speech_energy(chunk)
 
     def _detect_speech_energy(self, chunk: np.ndarray, threshold: float = 0.015) -> bool:
-        """Fallback: detección basada en energía RMS."""
-        if len(chunk) == 0:
+        """Fallback: detección basada en energía RMS.
+
+        Compara la energía media contra el umbral al cuadrado: `np.vdot` suma
+        los cuadrados en una sola pasada (BLAS) sin array temporal ni `sqrt`.
+        """
+        n = chunk.size
+        if n == 0:
             return False
-        energy = np.sqrt(np.mean(chunk**2))
-        return energy > threshold
+        return float(np.vdot(chunk, chunk)) > threshold * threshold * n
 
     # =========================================================================
     # Inferencia Whisper
     # =========================================================================
 
-    def _build_context_prompt(self) -> str:
-        """Build context prompt from sliding window.
+    def _update_context_window(self, text: str) -> None:
+        """Append to context window, keeping last 200 chars.
 
-        Uses last 200 chars to avoid Whisper's 224-token limit
-        which can cause looping hallucinations.
+        The window is stored already trimmed, so it is used verbatim as the
+        Whisper prompt (last 200 chars stay under the 224-token limit that
+        causes looping hallucinations) without re-slicing per inference.
         """
-        if not self._context_window:
-            return ""
-        return self._context_window[-CONTEXT_WINDOW_CHARS:]
-
-    def _update_context_window(self, text: str) -> None:
-        """Append to context window, keeping last 200 chars."""
         clean_text = text.strip()
         if clean_text:
-            self._context_window = (self._context_window + " " + clean_text)[-CONTEXT_WINDOW_CHARS:]
+            window = f"{self._context_window} {clean_text}" if self._context_window else clean_text
+            self._context_window = window[-CONTEXT_WINDOW_CHARS:]
+
+    @staticmethod
+    def _run_whisper(model, audio: np.ndarray, params: dict, prompt: str | None = None) -> str:
+        """Ejecuta `model.transcribe` en el hilo del worker.
+
+        Se define una sola vez en lugar de crear un closure por llamada;
+        el audio, los kwargs congelados del modo y el prompt viajan como
+        argumentos de `run_inference`. El generador de segmentos se consume
+        y une aquí mismo, sin materializar una lista ni ocupar el event loop
+        con el join.
+        """
+        segments, _info = model.transcribe(audio, initial_prompt=prompt, **params)
+        return " ".join(text for s in segments if (text := s.text.strip()))
+
+    async def _transcribe_audio(self, audio: np.ndarray, base_params: dict) -> str:
+        """Camino común de inferencia provisional y final.
+
+        Pasa los kwargs precalculados del modo tal cual (sin copiarlos) junto
+        con el prompt de contexto actual y delega en el worker. Los segmentos
+        de silencio digital (RMS < DEAD_AIR_RMS) se descartan sin pasar por
+        el encoder. Los errores se propagan para que cada
+        llamador decida cómo registrarlos.
 
-    async def _infer_provisional(self, audio_chunks: list[np.ndarray]) -> str:
+        Args:
+            audio: Audio del segmento actual (vista del buffer de segmento).
+            base_params: Kwargs de transcribe precalculados en `__init__`.
+
+        Returns:
+            str: Texto transcrito (vacío si Whisper no devuelve segmentos).
+        """
+        if float(np.vdot(audio, audio)) < DEAD_AIR_RMS * DEAD_AIR_RMS * audio.size:
+            return ""
+        return await self.worker.run_inference(self._run_whisper, audio, base_params, self._context_window or None)
+
+    async def _infer_provisional(self, audio: np.ndarray) -> str:
         """Fast provisional inference for real-time feedback.
 
         Uses greedy decoding (beam_size=1) for speed.
         """
-        if not audio_chunks:
+        if audio.size == 0:
             return ""
 
-        full_audio = np.concatenate(audio_chunks)
-        whisper_config = config.transcription.whisper
-        context_prompt = self._build_context_prompt()
-
-        def _inference_func(model):
-            segments, _ = model.transcribe(
-                full_audio,
-                language=whisper_config.language if whisper_config.language != "auto" else None,
-                task="transcribe",
-                beam_size=1,  # Greedy for speed
-                best_of=1,
-                temperature=0.0,
-                initial_prompt=context_prompt if context_prompt else None,
-                condition_on_previous_text=False,  # Avoid conflict with manual prompt
-                vad_filter=True,
-            )
-            return list(segments)
-
         try:
-            segments = await self.worker.run_inference(_inference_func)
-            text = " ".join(s.text.strip() for s in segments if s.text)
-            return text
+            return await self._transcribe_audio(audio, self._provisional_params)
         except Exception as e:
-            logger.debug(f"Provisional inference error: {e}")
+            logger.debug("Provisional inference error: %s", e)
             return ""
 
-    async def _infer_final(self, audio_chunks: list[np.ndarray]) -> str:
+    async def _infer_final(self, audio: np.ndarray) -> str:
         """High-quality final inference for committed segments.
 
         Uses configured beam search and VAD parameters.
         """
-        if not audio_chunks:
+        if audio.size == 0:
             return ""
 
-        full_audio = np.concatenate(audio_chunks)
-        whisper_config = config.transcription.whisper
-        context_prompt = self._build_context_prompt()
-
-        def _inference_func(model):
-            vad_params = None
-            if whisper_config.vad_filter:
-                vad_params = whisper_config.vad_parameters.model_dump()
-
-            segments, _info = model.transcribe(
-                full_audio,
-                language=whisper_config.language if whisper_config.language != "auto" else None,
-                task="transcribe",
-                beam_size=whisper_config.beam_size,
-                best_of=whisper_config.best_of,
-                temperature=whisper_config.temperature,
-                initial_prompt=context_prompt if context_prompt else None,
-                condition_on_previous_text=False,  # Avoid conflict with manual prompt
-                vad_filter=whisper_config.vad_filter,
-                vad_parameters=vad_params,
-            )
-            return list(segments)
-
         try:
-            segments = await self.worker.run_inference(_inference_func)
-            text = " ".join(s.text.strip() for s in segments if s.text)
+            text = await self._transcribe_audio(audio, self._final_params)
             if not text:
                 logger.debug("Final inference empty (VAD filtered or silence)")
             return text
         except Exception as e:
-            logger.error(f"Final inference error: {e}")
+            logger.error("Final inference error: %s", e)
             return ""
@@ -8,7 +8,6 @@ y gestión del portapapeles.
 import os
 import shutil
 import subprocess
-import time
 from pathlib import Path
 
 from v2m.features.desktop.interfaces import ClipboardInterface, NotificationInterface
@@ -28,6 +27,9 @@ class LinuxClipboardAdapter(ClipboardInterface):
         self._backend: str | None = None
         self._env: dict = {}
         self._detect_environment()
+        # Entorno combinado precalculado: evita os.environ.copy() en cada copy()/paste()
+        self._merged_env: dict[str, str] = {**os.environ, **self._env}
+        self._copy_cmd, self._paste_cmd = self._resolve_clipboard_commands()
 
     def _find_xauthority(self) -> str | None:
         """Localiza el archivo .Xauthority necesario para X11.
@@ -91,13 +93,13 @@ class LinuxClipboardAdapter(ClipboardInterface):
                     session_id = parts[0]
 
                     try:
-                        session_type = subprocess.check_output(
-                            ["loginctl", "show-session", session_id, "-p", "Type", "--value"], text=True
-                        ).strip()
-
-                        display_val = subprocess.check_output(
-                            ["loginctl", "show-session", session_id, "-p", "Display", "--value"], text=True
-                        ).strip()
+                        # Una sola llamada por sesión para ambas propiedades (salida "Clave=valor")
+                        props_output = subprocess.check_output(
+                            ["loginctl", "show-session", session_id, "-p", "Type", "-p", "Display"], text=True
+                        )
+                        props = dict(prop.split("=", 1) for prop in props_output.strip().splitlines() if "=" in prop)
+                        session_type = props.get("Type", "").strip()
+                        display_val = props.get("Display", "").strip()
 
                         if display_val:
                             self._backend = "wayland" if session_type == "wayland" else "x11"
@@ -126,12 +128,34 @@ class LinuxClipboardAdapter(ClipboardInterface):
         self._backend = "x11"
         self._env = {"DISPLAY": ":0"}
 
-    def _get_clipboard_commands(self) -> tuple[list, list]:
-        """Devuelve los comandos de copiar y pegar según el backend."""
+    def _resolve_clipboard_commands(self) -> tuple[list, list]:
+        """Resuelve una sola vez las rutas absolutas de las herramientas de portapapeles.
+
+        Evita la búsqueda en PATH en cada operación y reporta en el arranque
+        si falta la herramienta, en lugar de descubrirlo en la primera copia.
+
+        Returns:
+            tuple[list, list]: Comandos de copiar y pegar para el backend detectado.
+        """
         if self._backend == "wayland":
-            return (["wl-copy"], ["wl-paste"])
+            copy_tool, paste_tool = "wl-copy", "wl-paste"
+            copy_args, paste_args = [], []
         else:  # x11
-            return (["xclip", "-selection", "clipboard"], ["xclip", "-selection", "clipboard", "-out"])
+            copy_tool = paste_tool = "xclip"
+            copy_args, paste_args = ["-selection", "clipboard"], ["-selection", "clipboard", "-out"]
+
+        resolved = {}
+        for tool in {copy_tool, paste_tool}:
+            path = shutil.which(tool, path=self._merged_env.get("PATH"))
+            if path is None:
+                logger.warning(f"herramienta de portapapeles no encontrada: {tool}. instale xclip o wl-clipboard.")
+            resolved[tool] = path or tool
+
+        return ([resolved[copy_tool], *copy_args], [resolved[paste_tool], *paste_args])
+
+    def _get_clipboard_commands(self) -> tuple[list, list]:
+        """Devuelve los comandos de copiar y pegar resueltos en la inicialización."""
+        return self._copy_cmd, self._paste_cmd
 
     def copy(self, text: str) -> None:
         """Copia texto al portapapeles."""
@@ -140,20 +164,24 @@ class LinuxClipboardAdapter(ClipboardInterface):
         copy_cmd, _ = self._get_clipboard_commands()
 
         try:
-            env = os.environ.copy()
-            env.update(self._env)
-
             process = subprocess.Popen(
-                copy_cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env
+                copy_cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=self._merged_env
             )
 
             process.stdin.write(text.encode("utf-8"))
             process.stdin.close()
 
-            time.sleep(0.1)  # Pequeña espera para asegurar inicio
-            exit_code = process.poll()
-
-            if exit_code is not None and exit_code != 0:
+            # Esperar solo lo necesario: xclip/wl-copy se bifurcan y el proceso padre
+            # termina apenas toma el contenido. No se usa communicate() porque el hijo
+            # bifurcado hereda el pipe de stderr y lo mantiene abierto.
+            try:
+                exit_code = process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                logger.error("proceso de portapapeles agotó el tiempo de espera")
+                return
+
+            if exit_code != 0:
                 stderr_out = process.stderr.read().decode()
                 logger.error(f"proceso de portapapeles falló con código {exit_code}: {stderr_out}")
             else:
@@ -171,10 +199,7 @@ class LinuxClipboardAdapter(ClipboardInterface):
         _, paste_cmd = self._get_clipboard_commands()
 
         try:
-            env = os.environ.copy()
-            env.update(self._env)
-
-            result = subprocess.run(paste_cmd, capture_output=True, env=env, timeout=2)
+            result = subprocess.run(paste_cmd, capture_output=True, env=self._merged_env, timeout=2)
 
             if result.returncode != 0:
                 logger.error(f"falló el pegado del portapapeles: {result.stderr.decode('utf-8', errors='ignore')}")
@@ -80,6 +80,7 @@ class LinuxNotificationService(NotificationInterface):
 
             config = app_config.notifications
 
+        self._enabled: bool = config.enabled
         self._expire_time_ms: int = config.expire_time_ms
         self._auto_dismiss: bool = config.auto_dismiss
         self._pending_count: int = 0
@@ -119,6 +120,11 @@ class LinuxNotificationService(NotificationInterface):
             cls._executor = None
             logger.debug("cierre del executor de notificaciones completado")
 
+    @property
+    def enabled(self) -> bool:
+        """Indica si las notificaciones están activadas en la configuración."""
+        return self._enabled
+
     def notify(self, title: str, message: str) -> None:
         """Envía una notificación al escritorio con auto-dismiss opcional.
 
@@ -129,6 +135,9 @@ class LinuxNotificationService(NotificationInterface):
             title: Título breve y descriptivo.
             message: Cuerpo del mensaje.
         """
+        if not self._enabled:
+            return
+
         result = self._send_notification(title, message)
 
         if result.success and self._auto_dismiss and result.notification_id is not None:
@@ -13,6 +13,8 @@ Características clave:
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import httpx
 from ollama import AsyncClient
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
@@ -23,6 +25,28 @@ from v2m.shared.logging import logger
 from v2m.shared.errors import LLMError
 from v2m.features.llm.schemas import CorrectionResult
 
+# El esquema es estático: se genera una sola vez en lugar de recorrer el modelo por petición
+_CORRECTION_SCHEMA: dict = CorrectionResult.model_json_schema()
+
+
+@lru_cache(maxsize=32)
+def _translation_system_message(target_lang: str) -> dict[str, str]:
+    """Construye (y cachea por idioma) el mensaje de sistema para traducción.
+
+    Args:
+        target_lang: Idioma destino ya validado.
+
+    Returns:
+        dict[str, str]: Mensaje `system` listo para `AsyncClient.chat`.
+    """
+    return {
+        "role": "system",
+        "content": (
+            f"Eres un traductor experto. Traduce el siguiente texto al idioma '{target_lang}'. "
+            "Devuelve SOLO el texto traducido, sin explicaciones ni notas adicionales."
+        ),
+    }
+
 
 class OllamaLLMService(LLMService):
     """Servicio LLM utilizando Ollama con Salidas Estructuradas.
@@ -38,6 +62,7 @@ class OllamaLLMService(LLMService):
     def __init__(self) -> None:
         """Inicializa el servicio LLM de Ollama."""
         self._config = config.llm.ollama
+        # Cliente propio (pool httpx ligado al event loop que lo usa); se cierra en close()
         self._client = AsyncClient(host=self._config.host)
 
         # Cargar prompt del sistema
@@ -48,6 +73,9 @@ class OllamaLLMService(LLMService):
             logger.warning("prompt del sistema no encontrado, usando valor por defecto")
             self.system_prompt = "Eres un editor experto. Corrige gramática y coherencia del texto."
 
+        # Mensaje de sistema precalculado y reutilizado por referencia en cada petición
+        self._system_message = {"role": "system", "content": self.system_prompt}
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=0.5, min=0.5, max=2),
@@ -75,10 +103,10 @@ class OllamaLLMService(LLMService):
             response = await self._client.chat(
                 model=self._config.model,
                 messages=[
-                    {"role": "system", "content": self.system_prompt},
+                    self._system_message,
                     {"role": "user", "content": text},
                 ],
-                format=CorrectionResult.model_json_schema(),
+                format=_CORRECTION_SCHEMA,
                 options={
                     "temperature": self._config.temperature,
                     "keep_alive": self._config.keep_alive,
@@ -119,15 +147,10 @@ class OllamaLLMService(LLMService):
         try:
             logger.info(f"traduciendo texto a {target_lang} con ollama...")
 
-            system_instruction = (
-                f"Eres un traductor experto. Traduce el siguiente texto al idioma '{target_lang}'. "
-                "Devuelve SOLO el texto traducido, sin explicaciones ni notas adicionales."
-            )
-
             response = await self._client.chat(
                 model=self._config.model,
                 messages=[
-                    {"role": "system", "content": system_instruction},
+                    _translation_system_message(target_lang),
                     {"role": "user", "content": text},
                 ],
                 options={
@@ -142,3 +165,7 @@ class OllamaLLMService(LLMService):
         except Exception as e:
             logger.error(f"error traduciendo con ollama: {e}")
             raise LLMError(f"falló la traducción con ollama: {e}") from e
+
+    async def close(self) -> None:
+        """Cierra el `AsyncClient` y su pool de conexiones httpx."""
+        await self._client.close()
@@ -5,6 +5,7 @@ import sys
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import numpy as np
 import psutil
 from faster_whisper import WhisperModel
 
@@ -23,6 +24,38 @@ def _safe_log(level: int, msg: str) -> None:
         pass
 
 
+def _cpu_compute_type(compute_type: str) -> str:
+    """Traduce un compute_type de GPU a su equivalente cuantizado para CPU.
+
+    CTranslate2 no tiene kernels float16 eficientes en CPU y convertiría los
+    pesos a float32; int8 usa productos punto enteros (VNNI) con ~2x de
+    throughput y la mitad de memoria.
+    """
+    return "int8" if "float16" in compute_type else compute_type
+
+
+def _supports_flash_attention(device_index: int) -> bool:
+    """Indica si la GPU soporta Flash Attention 2 en CTranslate2 (Ampere+, cc >= 8.0)."""
+    try:
+        import torch
+
+        return torch.cuda.is_available() and torch.cuda.get_device_capability(device_index)[0] >= 8
+    except Exception:
+        return False
+
+
+# Modelos "large" con decoder completo (32 capas): demasiado lentos para streaming en CPU
+_FULL_LARGE_MODELS = frozenset({"large", "large-v1", "large-v2", "large-v3"})
+# distil-large-v3 solo transcribe inglés: para el resto de idiomas se usa turbo (multilingüe)
+_CPU_FALLBACK_MODEL = "large-v3-turbo"
+_CPU_FALLBACK_MODEL_EN = "distil-large-v3"
+
+
+def _cpu_fallback_model(language: str | None) -> str:
+    """Modelo ligero para CPU que conserva el idioma configurado."""
+    return _CPU_FALLBACK_MODEL_EN if language == "en" else _CPU_FALLBACK_MODEL
+
+
 class PersistentWhisperWorker:
     """Gestiona una instancia persistente del modelo Whisper en un hilo dedicado.
     Implementa política de 'keep-warm' por defecto, liberando recursos solo bajo presión de memoria.
@@ -32,17 +65,27 @@ class PersistentWhisperWorker:
         self,
         model_size: str,
         device: str = "cuda",
-        compute_type: str = "float16",
+        compute_type: str = "int8_float16",
         device_index: int = 0,
         num_workers: int = 1,
         keep_warm: bool = True,
+        flash_attention: bool = False,
+        language: str | None = None,
     ):
         self.model_size = model_size
         self.device = device
-        self.compute_type = compute_type
+        self.compute_type = _cpu_compute_type(compute_type) if device == "cpu" else compute_type
         self.device_index = device_index
         self.num_workers_whisper = num_workers
         self.keep_warm = keep_warm
+        self.flash_attention = flash_attention
+        self.language = language
+
+        if device == "cpu" and model_size in _FULL_LARGE_MODELS:
+            _safe_log(
+                logging.WARNING,
+                f"Modelo {model_size} en CPU tendrá alta latencia; considera '{_cpu_fallback_model(language)}'",
+            )
 
         self._model: WhisperModel | None = None
         self._lock = asyncio.Lock()
@@ -55,6 +98,17 @@ class PersistentWhisperWorker:
             async with self._lock:
                 await self._load_model()
 
+    async def warmup(self) -> None:
+        """Precarga el modelo (con inferencia de warmup) en el hilo del worker.
+
+        Toma el mismo lock que `run_inference`: una inferencia que llegue durante
+        el warmup (ej. el usuario graba recién arrancado el daemon) espera a que
+        termine en lugar de lanzar una segunda carga en frío en paralelo.
+        """
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self.initialize_sync)
+
     def initialize_sync(self):
         """Carga síncrona para warmup en hilos (Container)."""
         if self.keep_warm and self._model is None:
@@ -68,6 +122,11 @@ class PersistentWhisperWorker:
                     if not torch.cuda.is_available():
                         _safe_log(logging.WARNING, "CUDA solicitado pero no disponible, usando CPU")
                         self.device = "cpu"
+                        self.compute_type = _cpu_compute_type(self.compute_type)
+                        if self.model_size in _FULL_LARGE_MODELS:
+                            fallback = _cpu_fallback_model(self.language)
+                            _safe_log(logging.WARNING, f"Usando {fallback} en lugar de {self.model_size} en CPU")
+                            self.model_size = fallback
                     else:
                         gpu_name = torch.cuda.get_device_name(self.device_index)
                         _safe_log(logging.INFO, f"GPU detectada: {gpu_name}")
@@ -75,8 +134,25 @@ class PersistentWhisperWorker:
                     _safe_log(logging.DEBUG, "PyTorch no disponible para verificación de CUDA")
 
             self._model = self._create_model()
+            self._warmup_inference()
             _safe_log(logging.INFO, f"Modelo precargado. [device={self.device}, compute_type={self.compute_type}]")
 
+    def _warmup_inference(self) -> None:
+        """Corre una inferencia descartable sobre 1s de silencio.
+
+        La carga de pesos no inicializa el contexto CUDA ni los kernels de
+        cuBLAS/CTranslate2; sin esto la primera transcripción real paga ese
+        costo en el camino crítico del usuario.
+        """
+        try:
+            segments, _info = self._model.transcribe(
+                np.zeros(16000, dtype=np.float32), language="en", beam_size=1, vad_filter=False
+            )
+            for _ in segments:
+                pass
+        except Exception as e:
+            _safe_log(logging.WARNING, f"Inferencia de warmup falló (se continúa): {e}")
+
     async def run_inference(self, func, *args, **kwargs):
         """Ejecuta una función de inferencia (que usa el modelo) en el executor dedicado.
         La función `func` debe aceptar `model` como primer argumento.
@@ -129,12 +205,29 @@ class PersistentWhisperWorker:
             raise
 
     def _create_model(self):
+        # Flash Attention reduce el costo de atención del decoder en batch=1; solo
+        # se activa en GPUs que lo soportan para no fallar la carga en hardware previo
+        use_flash_attention = (
+            self.flash_attention and self.device == "cuda" and _supports_flash_attention(self.device_index)
+        )
+        try:
+            return self._build_model(flash_attention=use_flash_attention)
+        except Exception as e:
+            if not use_flash_attention:
+                raise
+            # Las wheels de CTranslate2 en PyPI (>= 4.4) no incluyen Flash Attention
+            _safe_log(logging.WARNING, f"Flash Attention no disponible en CTranslate2, se desactiva: {e}")
+            self.flash_attention = False
+            return self._build_model(flash_attention=False)
+
+    def _build_model(self, flash_attention: bool) -> WhisperModel:
         return WhisperModel(
             self.model_size,
             device=self.device,
             compute_type=self.compute_type,
             device_index=self.device_index,
             num_workers=self.num_workers_whisper,
+            flash_attention=flash_attention,
         )
 
     def _is_memory_critical(self) -> bool:
@@ -26,30 +26,33 @@ DEFAULT_PORT = 8765
 DEFAULT_HOST = "127.0.0.1"
 
 
-def _setup_uvloop() -> None:
-    """Configura uvloop como el bucle de eventos si está disponible.
+def _select_event_loop() -> str:
+    """Elige la implementación del bucle de eventos para Uvicorn.
 
-    Optimiza el rendimiento de I/O asíncrono en sistemas *nix, proporcionando
-    hasta 2-4x mejor throughput en operaciones de networking.
+    uvloop optimiza el rendimiento de I/O asíncrono en sistemas *nix,
+    proporcionando hasta 2-4x mejor throughput en operaciones de networking.
+    Se pasa explícitamente a Uvicorn, que crea el bucle con él; `uvloop.install()`
+    está deprecado desde Python 3.12.
 
-    Note:
-        Solo tiene efecto en Linux/macOS. En Windows se ignora silenciosamente.
+    Returns:
+        str: "uvloop" si está instalado, "asyncio" en caso contrario (ej. Windows).
     """
     try:
-        import uvloop
-
-        uvloop.install()
-        logger.debug("uvloop habilitado")
+        import uvloop  # noqa: F401
     except ImportError:
-        pass
+        return "asyncio"
+
+    logger.debug("uvloop habilitado")
+    return "uvloop"
 
 
-def _run_server(host: str, port: int) -> None:
+def _run_server(host: str, port: int, loop: str = "auto") -> None:
     """Inicia el servidor FastAPI con Uvicorn.
 
     Args:
         host: Dirección IP o hostname para bind (ej. '127.0.0.1', '0.0.0.0').
         port: Puerto TCP para escuchar (ej. 8765).
+        loop: Implementación del bucle de eventos ("uvloop", "asyncio" o "auto").
 
     Note:
         El servidor se ejecuta en modo síncrono (blocking). Para desarrollo,
@@ -64,6 +67,7 @@ def _run_server(host: str, port: int) -> None:
         "v2m.api.app:app",
         host=host,
         port=port,
+        loop=loop,
         log_level="info",
         # Desactivar reload en producción - activar con --reload para desarrollo
     )
@@ -79,7 +83,11 @@ def _send_http_command(command: str, port: int) -> None:
     Raises:
         SystemExit: Si el comando es desconocido o el servidor no responde.
     """
-    import requests
+    # urllib (stdlib) en lugar de requests: el cliente se lanza en cada pulsación del
+    # atajo de teclado y `import requests` por sí solo cuesta ~200ms de arranque
+    import json
+    import urllib.error
+    import urllib.request
 
     base_url = f"http://127.0.0.1:{port}"
 
@@ -98,15 +106,18 @@ def _send_http_command(command: str, port: int) -> None:
         sys.exit(1)
 
     method, path = endpoint_map[command.lower()]
-    url = f"{base_url}{path}"
+    request = urllib.request.Request(f"{base_url}{path}", method=method)
+    timeout = 30 if method == "POST" else 5
 
     try:
-        response = requests.post(url, timeout=30) if method == "POST" else requests.get(url, timeout=5)
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            print(json.loads(response.read()))
 
-        response.raise_for_status()
-        print(response.json())
-
-    except requests.ConnectionError:
+    except urllib.error.HTTPError as e:
+        # HTTPError hereda de URLError: el servidor respondió, pero con error
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    except urllib.error.URLError:
         print(f"❌ No se pudo conectar al servidor en {base_url}")
         print("   Asegúrate de que el daemon esté corriendo: python -m v2m.main")
         sys.exit(1)
@@ -165,9 +176,9 @@ Ejemplos:
         _send_http_command(args.command, args.port)
     else:
         # Modo Servidor: iniciar FastAPI
-        _setup_uvloop()
+        loop = _select_event_loop()
         configure_gpu_environment()
-        _run_server(args.host, args.port)
+        _run_server(args.host, args.port, loop=loop)
 
 
 if __name__ == "__main__":
@@ -1,21 +1,44 @@
 """Workflow de Procesamiento LLM."""
 
 import asyncio
+import importlib
 import re
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
+from v2m.api.schemas import LLMResponse
 from v2m.shared.config import config
 from v2m.shared.logging import logger
+from v2m.shared.utils.notifications import notify_safely
+from v2m.shared.utils.text import preview
 
 if TYPE_CHECKING:
-    from v2m.api.schemas import LLMResponse
     from v2m.features.desktop.linux_adapters import LinuxClipboardAdapter
     from v2m.features.desktop.notification_service import LinuxNotificationService
+    from v2m.features.llm.service import LLMService
+
+# Código de idioma destino aceptado por translate_text (ej. "en", "pt-BR", "english")
+_TARGET_LANG_PATTERN = re.compile(r"[a-zA-Z\s\-]{2,20}")
+
+# Módulo de cada backend, importado en warmup para no pagarlo en la primera petición
+_BACKEND_MODULES = {
+    "gemini": "v2m.features.llm.gemini_service",
+    "ollama": "v2m.features.llm.ollama_service",
+    "local": "v2m.features.llm.local_service",
+}
 
 
 class LLMWorkflow:
+    __slots__ = (
+        "_backend_name",
+        "_clipboard",
+        "_llm_service",
+        "_notifications",
+    )
+
     def __init__(self) -> None:
-        self._llm_service: Any | None = None
+        self._llm_service: LLMService | None = None
+        # La config es inmutable: el backend se lee una vez y no en cada petición
+        self._backend_name: str = config.llm.backend
         self._clipboard: LinuxClipboardAdapter | None = None
         self._notifications: LinuxNotificationService | None = None
 
@@ -35,10 +58,26 @@ class LLMWorkflow:
             self._notifications = LinuxNotificationService()
         return self._notifications
 
+    async def _notify(self, title: str, message: str) -> None:
+        await notify_safely(lambda: self.notifications, title, message)
+
+    async def warmup(self) -> None:
+        """Importa el módulo del backend configurado en un hilo aparte.
+
+        Los SDKs (google-genai, ollama, llama.cpp) tardan cientos de ms en
+        importarse; así la primera petición solo construye el servicio. La
+        construcción sigue siendo perezosa y en el event loop.
+        """
+        module = _BACKEND_MODULES.get(self._backend_name, _BACKEND_MODULES["local"])
+        try:
+            await asyncio.to_thread(importlib.import_module, module)
+        except Exception as e:
+            logger.warning("⚠️ Error precargando backend LLM %s: %s", self._backend_name, e)
+
     @property
-    def llm_service(self) -> Any:
+    def llm_service(self) -> "LLMService":
         if self._llm_service is None:
-            backend = config.llm.backend
+            backend = self._backend_name
             if backend == "gemini":
                 from v2m.features.llm.gemini_service import GeminiLLMService
 
@@ -51,44 +90,44 @@ class LLMWorkflow:
                 from v2m.features.llm.local_service import LocalLLMService
 
                 self._llm_service = LocalLLMService()
-            logger.info(f"LLM backend inicializado: {backend}")
+            logger.info("LLM backend inicializado: %s", backend)
         return self._llm_service
 
-    async def process_text(self, text: str) -> "LLMResponse":
-        from v2m.api.schemas import LLMResponse
+    async def shutdown(self) -> None:
+        """Libera los recursos del backend (p. ej. el pool HTTP de Ollama) si los tiene."""
+        close = getattr(self._llm_service, "close", None)
+        if close is None:
+            return
+        try:
+            await close()
+        except Exception as e:
+            logger.warning("Error cerrando backend LLM %s: %s", self._backend_name, e)
 
-        backend_name = config.llm.backend
+    async def process_text(self, text: str) -> LLMResponse:
+        backend_name = self._backend_name
         try:
-            if asyncio.iscoroutinefunction(self.llm_service.process_text):
-                refined = await self.llm_service.process_text(text)
-            else:
-                refined = await asyncio.to_thread(self.llm_service.process_text, text)
-            self.clipboard.copy(refined)
-            self.notifications.notify(f"✅ {backend_name} - copiado", f"{refined[:80]}...")
+            refined = await self.llm_service.process_text(text)
+            await asyncio.to_thread(self.clipboard.copy, refined)
+            await self._notify(f"✅ {backend_name} - copiado", preview(refined))
             return LLMResponse(text=refined, backend=backend_name)
         except Exception as e:
-            logger.error(f"Error procesando texto con {backend_name}: {e}")
-            self.clipboard.copy(text)
-            self.notifications.notify(f"⚠️ {backend_name} falló", "usando texto original...")
+            logger.error("Error procesando texto con %s: %s", backend_name, e)
+            await asyncio.to_thread(self.clipboard.copy, text)
+            await self._notify(f"⚠️ {backend_name} falló", "usando texto original...")
             return LLMResponse(text=text, backend=f"{backend_name} (fallback)")
 
-    async def translate_text(self, text: str, target_lang: str) -> "LLMResponse":
-        from v2m.api.schemas import LLMResponse
-
-        backend_name = config.llm.backend
-        if not re.match(r"^[a-zA-Z\s\-]{2,20}$", target_lang):
-            logger.warning(f"Idioma inválido: {target_lang}")
-            self.notifications.notify("❌ Error", "Idioma de destino inválido")
+    async def translate_text(self, text: str, target_lang: str) -> LLMResponse:
+        backend_name = self._backend_name
+        if not _TARGET_LANG_PATTERN.fullmatch(target_lang):
+            logger.warning("Idioma inválido: %s", target_lang)
+            await self._notify("❌ Error", "Idioma de destino inválido")
             return LLMResponse(text=text, backend="error")
         try:
-            if asyncio.iscoroutinefunction(self.llm_service.translate_text):
-                translated = await self.llm_service.translate_text(text, target_lang)
-            else:
-                translated = await asyncio.to_thread(self.llm_service.translate_text, text, target_lang)
-            self.clipboard.copy(translated)
-            self.notifications.notify(f"✅ Traducción ({target_lang})", f"{translated[:80]}...")
+            translated = await self.llm_service.translate_text(text, target_lang)
+            await asyncio.to_thread(self.clipboard.copy, translated)
+            await self._notify(f"✅ Traducción ({target_lang})", preview(translated))
             return LLMResponse(text=translated, backend=backend_name)
         except Exception as e:
-            logger.error(f"Error traduciendo con {backend_name}: {e}")
-            self.notifications.notify("❌ Error traducción", "Fallo al traducir")
+            logger.error("Error traduciendo con %s: %s", backend_name, e)
+            await self._notify("❌ Error traducción", "Fallo al traducir")
             return LLMResponse(text=text, backend=f"{backend_name} (error)")
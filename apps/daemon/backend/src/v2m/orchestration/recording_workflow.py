@@ -5,13 +5,17 @@ llega al portapapeles.
 """
 
 import asyncio
+import importlib
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Protocol
 
+from v2m.api.schemas import StatusResponse, ToggleResponse
 from v2m.shared.config import config
 from v2m.shared.logging import logger
+from v2m.shared.utils.notifications import notify_safely
+from v2m.shared.utils.text import preview
 
 if TYPE_CHECKING:
-    from v2m.api.schemas import StatusResponse, ToggleResponse
     from v2m.features.audio.recorder import AudioRecorder
     from v2m.features.audio.streaming_transcriber import StreamingTranscriber
     from v2m.features.desktop.linux_adapters import LinuxClipboardAdapter
@@ -19,11 +23,24 @@ if TYPE_CHECKING:
     from v2m.features.transcription.persistent_model import PersistentWhisperWorker
 
 
+@lru_cache(maxsize=4)
+def _status_response(recording: bool, model_loaded: bool) -> StatusResponse:
+    """Retorna la respuesta de /status para el par de flags, construida una sola vez.
+
+    Solo hay cuatro combinaciones posibles y `StatusResponse` es inmutable,
+    así que el polling del estado no instancia ni valida un modelo por petición.
+    """
+    state = "recording" if recording else "idle"
+    return StatusResponse(state=state, recording=recording, model_loaded=model_loaded)
+
+
 class BroadcastFn(Protocol):
     async def __call__(self, event_type: str, data: dict[str, Any]) -> None: ...
 
 
 class WebSocketSessionAdapter:
+    __slots__ = ("_broadcast_fn",)
+
     def __init__(self, broadcast_fn: BroadcastFn | None = None) -> None:
         self._broadcast_fn = broadcast_fn
 
@@ -33,9 +50,24 @@ class WebSocketSessionAdapter:
 
 
 class RecordingWorkflow:
+    __slots__ = (
+        "_broadcast_fn",
+        "_clipboard",
+        "_is_recording",
+        "_model_loaded",
+        "_notifications",
+        "_recorder",
+        "_state_lock",
+        "_transcriber",
+        "_worker",
+    )
+
     def __init__(self, broadcast_fn: BroadcastFn | None = None) -> None:
         self._is_recording = False
         self._model_loaded = False
+        # Serializa la transición start/stop: sin él, dos toggles simultáneos
+        # ven _is_recording=False y arrancan dos grabadores.
+        self._state_lock = asyncio.Lock()
         self._broadcast_fn = broadcast_fn
 
         self._worker: PersistentWhisperWorker | None = None
@@ -57,6 +89,8 @@ class RecordingWorkflow:
                 device_index=whisper_cfg.device_index,
                 num_workers=whisper_cfg.num_workers,
                 keep_warm=whisper_cfg.keep_warm,
+                flash_attention=whisper_cfg.flash_attention,
+                language=whisper_cfg.language,
             )
         return self._worker
 
@@ -102,67 +136,94 @@ class RecordingWorkflow:
             self._notifications = LinuxNotificationService()
         return self._notifications
 
+    async def _notify(self, title: str, message: str) -> None:
+        await notify_safely(lambda: self.notifications, title, message)
+
     async def warmup(self) -> None:
         if self._model_loaded:
             return
         try:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, self.worker.initialize_sync)
+            # faster-whisper/ctranslate2 tardan en importarse: fuera del event loop
+            await asyncio.to_thread(importlib.import_module, "v2m.features.transcription.persistent_model")
+            model_load = asyncio.ensure_future(self.worker.warmup())
+            await self._prewarm_services()
+            await model_load
             self._model_loaded = True
             logger.info("✅ Modelo Whisper precargado en VRAM")
         except Exception as e:
-            logger.error(f"❌ Error en warmup del modelo: {e}")
+            logger.error("❌ Error en warmup del modelo: %s", e)
+
+    async def _prewarm_services(self) -> None:
+        """Construye transcriptor, portapapeles y notificaciones mientras carga el modelo.
+
+        Sus imports y la detección del entorno de escritorio se solapan con la
+        carga en GPU en lugar de recaer sobre el primer toggle. Se hace bajo
+        `_state_lock` para que un toggle temprano no los construya en paralelo.
+        """
+        async with self._state_lock:
+            results = await asyncio.gather(
+                asyncio.to_thread(lambda: self.transcriber),
+                asyncio.to_thread(lambda: self.clipboard),
+                asyncio.to_thread(lambda: self.notifications),
+                return_exceptions=True,
+            )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("⚠️ Error precalentando servicio: %s", result)
 
-    async def toggle(self) -> "ToggleResponse":
-        if not self._is_recording:
-            return await self.start()
-        return await self.stop()
+    async def toggle(self) -> ToggleResponse:
+        async with self._state_lock:
+            if not self._is_recording:
+                return await self._start_locked()
+            return await self._stop_locked()
+
+    async def start(self) -> ToggleResponse:
+        async with self._state_lock:
+            return await self._start_locked()
 
-    async def start(self) -> "ToggleResponse":
-        from v2m.api.schemas import ToggleResponse
+    async def stop(self) -> ToggleResponse:
+        async with self._state_lock:
+            return await self._stop_locked()
 
+    async def _start_locked(self) -> ToggleResponse:
         if self._is_recording:
             return ToggleResponse(status="recording", message="⚠️ Ya está grabando")
         try:
             await self.transcriber.start()
             self._is_recording = True
-            config.paths.recording_flag.touch()
-            self.notifications.notify("🎤 voice2machine", "grabación iniciada...")
+            await asyncio.to_thread(config.paths.recording_flag.touch)
+            await self._notify("🎤 voice2machine", "grabación iniciada...")
             logger.info("🎙️ Grabación iniciada")
             return ToggleResponse(status="recording", message="🎙️ Grabando...")
         except Exception as e:
-            logger.error(f"Error iniciando grabación: {e}")
+            logger.error("Error iniciando grabación: %s", e)
             return ToggleResponse(status="error", message=f"❌ Error: {e}")
 
-    async def stop(self) -> "ToggleResponse":
-        from v2m.api.schemas import ToggleResponse
-
+    async def _stop_locked(self) -> ToggleResponse:
         if not self._is_recording:
             return ToggleResponse(status="idle", message="⚠️ No hay grabación en curso")
+        self._is_recording = False
+        try:
+            await asyncio.to_thread(config.paths.recording_flag.unlink, missing_ok=True)
+        except OSError as e:
+            # El flag es informativo: un fallo al borrarlo no impide detener el grabador
+            logger.warning("No se pudo borrar el flag de grabación: %s", e)
         try:
-            self._is_recording = False
-            if config.paths.recording_flag.exists():
-                config.paths.recording_flag.unlink()
-            self.notifications.notify("⚡ v2m procesando", "procesando...")
+            await self._notify("⚡ v2m procesando", "procesando...")
             transcription = await self.transcriber.stop()
             if not transcription or not transcription.strip():
-                self.notifications.notify("❌ whisper", "no se detectó voz en el audio")
+                await self._notify("❌ whisper", "no se detectó voz en el audio")
                 return ToggleResponse(status="idle", message="❌ No se detectó voz", text=None)
-            self.clipboard.copy(transcription)
-            preview = transcription[:80]
-            self.notifications.notify("✅ whisper - copiado", f"{preview}...")
-            logger.info(f"✅ Transcripción completada: {len(transcription)} chars")
+            await asyncio.to_thread(self.clipboard.copy, transcription)
+            await self._notify("✅ whisper - copiado", preview(transcription))
+            logger.info("✅ Transcripción completada: %d chars", len(transcription))
             return ToggleResponse(status="idle", message="✅ Copiado al portapapeles", text=transcription)
         except Exception as e:
-            logger.error(f"Error deteniendo grabación: {e}")
-            self._is_recording = False
+            logger.error("Error deteniendo grabación: %s", e)
             return ToggleResponse(status="error", message=f"❌ Error: {e}")
 
-    def get_status(self) -> "StatusResponse":
-        from v2m.api.schemas import StatusResponse
-
-        state = "recording" if self._is_recording else "idle"
-        return StatusResponse(state=state, recording=self._is_recording, model_loaded=self._model_loaded)
+    def get_status(self) -> StatusResponse:
+        return _status_response(self._is_recording, self._model_loaded)
 
     async def shutdown(self) -> None:
         if self._is_recording:
@@ -174,6 +235,6 @@ class RecordingWorkflow:
             try:
                 await self._worker.unload()
             except Exception as e:
-                logger.warning(f"Error descargando modelo: {e}")
+                logger.warning("Error descargando modelo: %s", e)
         if self._notifications:
             self._notifications.shutdown(wait=False)
@@ -0,0 +1,31 @@
+"""Utilidades de Notificación.
+
+Envío de notificaciones de escritorio desde los workflows sin bloquear el
+event loop ni interrumpir el flujo que las emite.
+"""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from v2m.shared.logging import logger
+
+
+async def notify_safely(get_service: Callable[[], Any], title: str, message: str) -> None:
+    """Envía una notificación en un hilo aparte, tragando cualquier error.
+
+    Con las notificaciones desactivadas se evita el salto al thread pool. Un
+    fallo al construir el servicio o al notificar nunca interrumpe el flujo
+    (p. ej. detener el grabador); solo se registra.
+
+    Args:
+        get_service: Devuelve el servicio de notificaciones (construcción perezosa).
+        title: Título de la notificación.
+        message: Cuerpo de la notificación.
+    """
+    try:
+        notifications = get_service()
+        if notifications.enabled:
+            await asyncio.to_thread(notifications.notify, title, message)
+    except Exception as e:
+        logger.warning("⚠️ Error enviando notificación: %s", e)
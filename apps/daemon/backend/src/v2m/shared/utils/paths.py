@@ -36,20 +36,23 @@ def get_secure_runtime_dir(app_name: str = "v2m") -> Path:
         uid = os.getuid()
         runtime_dir = Path(tempfile.gettempdir()) / f"{app_name}_{uid}"
 
-    # Asegurar que el directorio existe con permisos seguros (0700 - rwx------)
-    if not runtime_dir.exists():
+    # Un solo stat deriva existencia y metadatos (evita exists() + stat() y el TOCTOU entre ambos)
+    try:
+        stat = runtime_dir.stat()
+    except FileNotFoundError:
+        # Asegurar que el directorio existe con permisos seguros (0700 - rwx------)
         runtime_dir.mkdir(parents=True, exist_ok=True)
         os.chmod(runtime_dir, 0o700)
-    else:
-        # Si existe, verificar propiedad y permisos
-        stat = runtime_dir.stat()
-        if stat.st_uid != os.getuid():
-            # Riesgo de seguridad: otro usuario posee este directorio
-            raise PermissionError(f"El directorio de ejecución {runtime_dir} no pertenece al usuario actual.")
-
-        # Forzar 0700 si los permisos son incorrectos
-        if (stat.st_mode & 0o777) != 0o700:
-            with contextlib.suppress(OSError):
-                os.chmod(runtime_dir, 0o700)
+        return runtime_dir
+
+    # Si existe, verificar propiedad y permisos
+    if stat.st_uid != os.getuid():
+        # Riesgo de seguridad: otro usuario posee este directorio
+        raise PermissionError(f"El directorio de ejecución {runtime_dir} no pertenece al usuario actual.")
+
+    # Forzar 0700 si los permisos son incorrectos
+    if (stat.st_mode & 0o777) != 0o700:
+        with contextlib.suppress(OSError):
+            os.chmod(runtime_dir, 0o700)
 
     return runtime_dir
@@ -0,0 +1,25 @@
+"""Utilidades de Texto.
+
+Helpers de formato compartidos por los workflows para los mensajes al usuario.
+"""
+
+ELLIPSIS = "…"
+PREVIEW_LENGTH = 80
+
+
+def preview(text: str, limit: int = PREVIEW_LENGTH) -> str:
+    """Recorta `text` para mostrarlo en una notificación.
+
+    Los textos que caben se devuelven tal cual, sin copia ni sufijo; solo los
+    que exceden `limit` se truncan y terminan en `…`.
+
+    Args:
+        text: Texto completo.
+        limit: Número máximo de caracteres conservados.
+
+    Returns:
+        str: El texto original o su prefijo seguido de `…`.
+    """
+    if len(text) <= limit:
+        return text
+    return text[:limit] + ELLIPSIS
@@ -18,6 +18,7 @@ use rubato::{
 };
 use sysinfo::System;
 use std::sync::{Arc, Mutex};
+use std::time::{Duration, Instant};
 use tokio::sync::Notify;
 
 use cpal::traits::{DeviceTrait, HostTrait, StreamTrait};
@@ -470,6 +471,13 @@ impl VoiceActivityDetector {
 // MONITOR DE SISTEMA - Métricas CPU/RAM/GPU
 // ============================================================================
 
+/// `(cpu_pct, ram_total, ram_used, ram_pct, gpu_temp, vram_used, vram_total)`
+type MetricsSnapshot = (f32, u64, u64, f32, u32, u64, u64);
+
+/// Vida de un snapshot: sondeos dentro de esta ventana reutilizan el anterior.
+/// Además respeta el intervalo mínimo de sysinfo entre refrescos de CPU.
+const SNAPSHOT_TTL: Duration = Duration::from_millis(250);
+
 /// Implementación de SystemMonitor en Rust usando sysinfo.
 ///
 /// Provee recolección de métricas de sistema con bajo overhead vía syscalls nativas,
@@ -477,6 +485,7 @@ impl VoiceActivityDetector {
 #[pyclass]
 struct SystemMonitor {
     sys: System,
+    last_snapshot: Option<(Instant, MetricsSnapshot)>,
     #[cfg(feature = "nvidia")]
     nvml: Option<nvml_wrapper::Nvml>,
 }
@@ -501,12 +510,16 @@ impl SystemMonitor {
 
         SystemMonitor {
             sys: System::new_all(),
+            last_snapshot: None,
             #[cfg(feature = "nvidia")]
             nvml,
         }
     }
 
+    /// Refresca CPU y RAM e invalida el snapshot cacheado: tras un refresco
+    /// explícito, `snapshot()` vuelve a leer las métricas.
     fn update(&mut self) {
+        self.last_snapshot = None;
         self.sys.refresh_cpu_all();
         self.sys.refresh_memory();
     }
@@ -539,6 +552,53 @@ impl SystemMonitor {
         }
         0
     }
+
+    /// Refresca y devuelve todas las métricas en una sola llamada FFI.
+    ///
+    /// Equivale a `update()` + `get_cpu_usage()` + `get_ram_usage()` + `get_gpu_temp()`
+    /// más la VRAM, pero cruza la frontera Python/Rust una sola vez por sondeo.
+    ///
+    /// Retorna `(cpu_pct, ram_total, ram_used, ram_pct, gpu_temp, vram_used, vram_total)`;
+    /// los campos de GPU valen 0 si NVML no está disponible. Varios llamadores
+    /// dentro de `SNAPSHOT_TTL` (tick de WebSocket, health check) comparten el
+    /// mismo snapshot sin repetir syscalls ni consultas NVML.
+    fn snapshot(&mut self) -> MetricsSnapshot {
+        if let Some((taken_at, cached)) = self.last_snapshot {
+            if taken_at.elapsed() < SNAPSHOT_TTL {
+                return cached;
+            }
+        }
+
+        self.update();
+        let (ram_total, ram_used, ram_pct) = self.get_ram_usage();
+        let (vram_used, vram_total) = self.vram_usage();
+        let snapshot = (
+            self.get_cpu_usage(),
+            ram_total,
+            ram_used,
+            ram_pct,
+            self.get_gpu_temp(),
+            vram_used,
+            vram_total,
+        );
+        self.last_snapshot = Some((Instant::now(), snapshot));
+        snapshot
+    }
+}
+
+impl SystemMonitor {
+    /// Memoria de GPU `(usada, total)` en bytes; `(0, 0)` sin NVML.
+    fn vram_usage(&self) -> (u64, u64) {
+        #[cfg(feature = "nvidia")]
+        if let Some(ref nvml) = self.nvml {
+            if let Ok(device) = nvml.device_by_index(0) {
+                if let Ok(mem) = device.memory_info() {
+                    return (mem.used, mem.total);
+                }
+            }
+        }
+        (0, 0)
+    }
 }
 
 // ============================================================================
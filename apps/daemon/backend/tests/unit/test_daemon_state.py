@@ -0,0 +1,106 @@
+"""
+tests unitarios para DaemonState
+
+valida el broadcast de eventos a clientes websocket:
+- serialización única compartida por todos los clientes
+- colas acotadas por cliente: un cliente lento no bloquea al emisor
+- descarte de frames provisionales bajo backpressure
+- limpieza de clientes desconectados
+- cancelación de tareas en background al apagar
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+from v2m.api.app import WS_SEND_QUEUE_SIZE, DaemonState, _background_tasks, _cancel_background_tasks
+
+
+def _client(send_text=None) -> AsyncMock:
+    ws = AsyncMock()
+    if send_text is not None:
+        ws.send_text = send_text
+    return ws
+
+
+class TestBroadcastEvent:
+    """tests para DaemonState.broadcast_event"""
+
+    async def test_all_clients_receive_same_payload(self):
+        """el mensaje se serializa una vez y se envía idéntico a cada cliente"""
+        state = DaemonState()
+        clients = [_client(), _client()]
+        writers = [state.add_client(ws) for ws in clients]
+
+        await state.broadcast_event("transcription_update", {"text": "hola", "final": True})
+        await asyncio.gather(*(queue.join() for queue in state._websocket_clients.values()))
+
+        first, second = (ws.send_text.await_args.args[0] for ws in clients)
+        assert first is second
+        assert json.loads(first) == {"event": "transcription_update", "data": {"text": "hola", "final": True}}
+        for writer in writers:
+            writer.cancel()
+
+    async def test_slow_client_does_not_block_emitter(self):
+        """broadcast_event retorna sin esperar a que un cliente lento termine su envío"""
+        state = DaemonState()
+        never = asyncio.Event()
+
+        async def stalled_send(payload):
+            await never.wait()
+
+        fast = _client()
+        writers = [state.add_client(_client(stalled_send)), state.add_client(fast)]
+
+        await asyncio.wait_for(state.broadcast_event("heartbeat", {}), timeout=0.1)
+        await asyncio.wait_for(state._websocket_clients[fast].join(), timeout=1.0)
+
+        fast.send_text.assert_awaited_once()
+        for writer in writers:
+            writer.cancel()
+
+    async def test_failed_clients_are_removed(self):
+        """los clientes cuyo envío falla se descartan"""
+        state = DaemonState()
+        healthy = _client()
+        broken = _client(AsyncMock(side_effect=RuntimeError("closed")))
+        writers = [state.add_client(healthy), state.add_client(broken)]
+
+        await state.broadcast_event("heartbeat", {})
+        await asyncio.sleep(0.01)
+
+        assert list(state._websocket_clients) == [healthy]
+        for writer in writers:
+            writer.cancel()
+
+    async def test_full_queue_drops_provisional_but_keeps_final(self):
+        """con la cola llena se descartan provisionales y los finales desalojan el más antiguo"""
+        state = DaemonState()
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+        state._websocket_clients[_client()] = queue  # sin tarea escritora: cliente estancado
+
+        for i in range(WS_SEND_QUEUE_SIZE):
+            await state.broadcast_event("transcription_update", {"text": str(i), "final": False})
+        await state.broadcast_event("transcription_update", {"text": "late", "final": False})
+        await state.broadcast_event("transcription_update", {"text": "done", "final": True})
+
+        frames = [json.loads(queue.get_nowait())["data"]["text"] for _ in range(queue.qsize())]
+        assert len(frames) == WS_SEND_QUEUE_SIZE
+        assert "late" not in frames
+        assert frames[0] == "1"
+        assert frames[-1] == "done"
+
+
+class TestBackgroundTasks:
+    """tests para el registro de tareas en background"""
+
+    async def test_shutdown_cancels_pending_writers(self):
+        """al apagar se cancelan las escritoras pendientes y el registro queda vacío"""
+        state = DaemonState()
+        writer = state.add_client(_client())
+        assert writer in _background_tasks
+
+        await _cancel_background_tasks()
+
+        assert writer.cancelled()
+        assert not _background_tasks
@@ -0,0 +1,135 @@
+"""
+tests unitarios para LinuxClipboardAdapter
+
+valida el comportamiento del adaptador de portapapeles incluyendo:
+- entorno combinado precalculado para los subprocesos
+- espera acotada del proceso de copiado (sin sleep fijo)
+- detección vía loginctl con una sola consulta por sesión
+- resolución única de las herramientas de portapapeles
+"""
+
+import os
+import subprocess
+from unittest.mock import MagicMock, patch
+
+from v2m.features.desktop.linux_adapters import LinuxClipboardAdapter
+
+
+class TestDetectEnvironment:
+    """tests para la detección de entorno vía loginctl"""
+
+    @patch.dict(os.environ, {"USER": "testuser"}, clear=True)
+    @patch("shutil.which", return_value="/usr/bin/loginctl")
+    @patch("subprocess.check_output")
+    def test_single_show_session_call_per_session(self, mock_check_output, _mock_which):
+        """Type y Display se leen con una única llamada a show-session"""
+
+        def side_effect(cmd, **kwargs):
+            if cmd[1] == "list-sessions":
+                return "1 1000 testuser seat0 tty2\n"
+            return "Type=wayland\nDisplay=wayland-0\n"
+
+        mock_check_output.side_effect = side_effect
+
+        adapter = LinuxClipboardAdapter()
+
+        show_calls = [c for c in mock_check_output.call_args_list if c.args[0][1] == "show-session"]
+        assert len(show_calls) == 1
+        assert show_calls[0].args[0] == ["loginctl", "show-session", "1", "-p", "Type", "-p", "Display"]
+        assert adapter._backend == "wayland"
+        assert adapter._env == {"WAYLAND_DISPLAY": "wayland-0"}
+
+
+class TestClipboardCommands:
+    """tests para la resolución de herramientas de portapapeles"""
+
+    @patch.dict(os.environ, {"WAYLAND_DISPLAY": "wayland-0"}, clear=True)
+    @patch("shutil.which", side_effect=lambda tool, path=None: f"/usr/bin/{tool}")
+    def test_tools_resolved_to_absolute_paths_at_init(self, mock_which):
+        """las rutas se resuelven una vez al inicializar, no por operación"""
+        adapter = LinuxClipboardAdapter()
+        calls_after_init = mock_which.call_count
+
+        copy_cmd, paste_cmd = adapter._get_clipboard_commands()
+        adapter._get_clipboard_commands()
+
+        assert copy_cmd == ["/usr/bin/wl-copy"]
+        assert paste_cmd == ["/usr/bin/wl-paste"]
+        assert mock_which.call_count == calls_after_init
+
+    @patch.dict(os.environ, {"DISPLAY": ":0"}, clear=True)
+    @patch("shutil.which", return_value=None)
+    def test_missing_tool_falls_back_to_bare_name(self, _mock_which):
+        """si la herramienta no está instalada se conserva el nombre para el error en uso"""
+        adapter = LinuxClipboardAdapter()
+
+        copy_cmd, paste_cmd = adapter._get_clipboard_commands()
+
+        assert copy_cmd == ["xclip", "-selection", "clipboard"]
+        assert paste_cmd == ["xclip", "-selection", "clipboard", "-out"]
+
+
+class TestMergedEnvironment:
+    """tests para el entorno precalculado de los subprocesos"""
+
+    @patch.dict(os.environ, {"DISPLAY": ":1", "HOME": "/home/test"}, clear=True)
+    def test_merged_env_combines_process_env_and_detected_display(self):
+        """el entorno combinado incluye el entorno del proceso y la pantalla detectada"""
+        adapter = LinuxClipboardAdapter()
+
+        assert adapter._merged_env["HOME"] == "/home/test"
+        assert adapter._merged_env["DISPLAY"] == ":1"
+
+    @patch.dict(os.environ, {"DISPLAY": ":1"}, clear=True)
+    def test_copy_and_paste_reuse_merged_env(self):
+        """copy() y paste() pasan el mismo dict sin copiar os.environ por llamada"""
+        adapter = LinuxClipboardAdapter()
+
+        with (
+            patch("subprocess.Popen") as mock_popen,
+            patch("subprocess.run") as mock_run,
+            patch("os.environ.copy") as mock_environ_copy,
+        ):
+            mock_popen.return_value = MagicMock(returncode=0)
+            mock_popen.return_value.wait.return_value = 0
+            mock_run.return_value = MagicMock(returncode=0, stdout=b"hola")
+
+            adapter.copy("hola")
+            adapter.paste()
+
+        mock_environ_copy.assert_not_called()
+        assert mock_popen.call_args.kwargs["env"] is adapter._merged_env
+        assert mock_run.call_args.kwargs["env"] is adapter._merged_env
+
+
+class TestCopy:
+    """tests para LinuxClipboardAdapter.copy"""
+
+    @patch.dict(os.environ, {"DISPLAY": ":1"}, clear=True)
+    def test_copy_waits_for_process_without_fixed_sleep(self):
+        """copy() espera al proceso con timeout en lugar de dormir 100ms"""
+        adapter = LinuxClipboardAdapter()
+
+        with patch("subprocess.Popen") as mock_popen, patch("time.sleep") as mock_sleep:
+            process = mock_popen.return_value
+            process.wait.return_value = 0
+
+            adapter.copy("hola")
+
+        process.stdin.write.assert_called_once_with(b"hola")
+        process.stdin.close.assert_called_once()
+        process.wait.assert_called_once_with(timeout=2)
+        mock_sleep.assert_not_called()
+
+    @patch.dict(os.environ, {"DISPLAY": ":1"}, clear=True)
+    def test_copy_kills_process_on_timeout(self):
+        """si el proceso no termina a tiempo se mata en lugar de quedar colgado"""
+        adapter = LinuxClipboardAdapter()
+
+        with patch("subprocess.Popen") as mock_popen:
+            process = mock_popen.return_value
+            process.wait.side_effect = subprocess.TimeoutExpired(cmd="xclip", timeout=2)
+
+            adapter.copy("hola")
+
+        process.kill.assert_called_once()
@@ -0,0 +1,100 @@
+"""
+tests unitarios para LLMWorkflow
+
+valida el comportamiento del workflow LLM incluyendo:
+- validación del idioma destino antes de llamar al backend
+- notificaciones omitidas cuando están desactivadas
+- precarga del módulo del backend en el warmup
+- cierre de los recursos del backend al apagar
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from v2m.orchestration.llm_workflow import LLMWorkflow
+
+
+@pytest.fixture
+def workflow():
+    """workflow con servicio LLM, portapapeles y notificaciones mockeados"""
+    wf = LLMWorkflow()
+    wf._llm_service = MagicMock()
+    wf._llm_service.translate_text = AsyncMock(return_value="hello")
+    wf._clipboard = MagicMock()
+    wf._notifications = MagicMock()
+    return wf
+
+
+class TestTranslateText:
+    """tests para LLMWorkflow.translate_text"""
+
+    @pytest.mark.parametrize("target_lang", ["en", "pt-BR", "english"])
+    async def test_valid_language_reaches_backend(self, workflow, target_lang):
+        """los códigos de idioma válidos se traducen con el backend"""
+        response = await workflow.translate_text("hola", target_lang)
+
+        workflow._llm_service.translate_text.assert_awaited_once_with("hola", target_lang)
+        assert response.text == "hello"
+
+    @pytest.mark.parametrize("target_lang", ["e", "en; rm -rf", "es_ES", "x" * 21])
+    async def test_invalid_language_rejected(self, workflow, target_lang):
+        """un idioma inválido no llega al backend"""
+        response = await workflow.translate_text("hola", target_lang)
+
+        workflow._llm_service.translate_text.assert_not_awaited()
+        assert response.backend == "error"
+
+    async def test_disabled_notifications_are_not_dispatched(self, workflow):
+        """con las notificaciones desactivadas no se llama a notify"""
+        workflow._notifications.enabled = False
+
+        await workflow.translate_text("hola", "en")
+
+        workflow._notifications.notify.assert_not_called()
+
+
+class TestWarmup:
+    """tests para LLMWorkflow.warmup"""
+
+    async def test_warmup_imports_backend_without_building_service(self):
+        """el warmup importa el módulo del backend pero no construye el servicio"""
+        workflow = LLMWorkflow()
+        workflow._backend_name = "ollama"
+
+        with patch("v2m.orchestration.llm_workflow.importlib.import_module") as mock_import:
+            await workflow.warmup()
+
+        mock_import.assert_called_once_with("v2m.features.llm.ollama_service")
+        assert workflow._llm_service is None
+
+    async def test_warmup_survives_import_error(self):
+        """un backend que no se puede importar no rompe el arranque"""
+        workflow = LLMWorkflow()
+
+        with patch("v2m.orchestration.llm_workflow.importlib.import_module", side_effect=ImportError("llama_cpp")):
+            await workflow.warmup()
+
+        assert workflow._llm_service is None
+
+
+class TestShutdown:
+    """tests para LLMWorkflow.shutdown"""
+
+    async def test_shutdown_closes_backend(self, workflow):
+        """el apagado cierra el backend si expone close()"""
+        workflow._llm_service.close = AsyncMock()
+
+        await workflow.shutdown()
+
+        workflow._llm_service.close.assert_awaited_once()
+
+    async def test_shutdown_without_service_is_noop(self):
+        """sin backend construido el apagado no hace nada"""
+        await LLMWorkflow().shutdown()
+
+    async def test_shutdown_survives_close_error(self, workflow):
+        """un fallo al cerrar el backend no rompe el apagado"""
+        workflow._llm_service.close = AsyncMock(side_effect=RuntimeError("loop cerrado"))
+
+        await workflow.shutdown()
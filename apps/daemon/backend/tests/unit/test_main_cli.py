@@ -0,0 +1,66 @@
+"""
+tests unitarios para el cliente CLI de v2m.main
+
+valida que el cliente HTTP use solo la stdlib y conserve su contrato:
+- imprime la respuesta JSON del servidor
+- sale con código 1 si el daemon no está corriendo
+"""
+
+import io
+import json
+import sys
+import urllib.error
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from v2m.main import _select_event_loop, _send_http_command
+
+
+class TestSendHttpCommand:
+    """tests para _send_http_command"""
+
+    def test_posts_toggle_and_prints_json(self, capsys):
+        """toggle hace POST al endpoint y muestra la respuesta decodificada"""
+        body = io.BytesIO(json.dumps({"status": "recording"}).encode())
+
+        with patch("urllib.request.urlopen", return_value=body) as mock_urlopen:
+            _send_http_command("toggle", 8765)
+
+        request = mock_urlopen.call_args.args[0]
+        assert request.get_method() == "POST"
+        assert request.full_url == "http://127.0.0.1:8765/toggle"
+        assert mock_urlopen.call_args.kwargs["timeout"] == 30
+        assert "recording" in capsys.readouterr().out
+
+    def test_exits_when_daemon_is_not_running(self, capsys):
+        """un error de conexión termina con código 1 y un mensaje claro"""
+        with (
+            patch("urllib.request.urlopen", side_effect=urllib.error.URLError("refused")),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            _send_http_command("status", 8765)
+
+        assert exc_info.value.code == 1
+        assert "No se pudo conectar" in capsys.readouterr().out
+
+    def test_does_not_import_requests(self):
+        """el camino del cliente no importa requests (costo de arranque)"""
+        body = io.BytesIO(b"{}")
+
+        with patch.dict(sys.modules, {"requests": None}), patch("urllib.request.urlopen", return_value=body):
+            _send_http_command("health", 8765)
+
+
+class TestSelectEventLoop:
+    """tests para la selección del bucle de eventos del servidor"""
+
+    def test_prefers_uvloop_when_installed(self):
+        """con uvloop instalado se pide explícitamente a uvicorn"""
+        with patch.dict(sys.modules, {"uvloop": MagicMock()}):
+            assert _select_event_loop() == "uvloop"
+
+    def test_falls_back_to_asyncio(self):
+        """sin uvloop se usa el bucle estándar de asyncio"""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert _select_event_loop() == "asyncio"
@@ -1,4 +1,3 @@
-
 """
 tests unitarios para el servicio de notificaciones
 
@@ -23,6 +22,7 @@ class MockNotificationsConfig:
 
     expire_time_ms: int = 1000  # 1 segundo para tests rápidos
     auto_dismiss: bool = True
+    enabled: bool = True
 
 
 class TestNotificationResult:
@@ -160,6 +160,17 @@ class TestLinuxNotificationService:
         # nota: este es un test de comportamiento, no de implementación
         assert service._executor is not None
 
+    @patch("subprocess.run")
+    def test_disabled_notifications_skip_send(self, mock_run):
+        """con enabled=False notify() no lanza gdbus ni notify-send"""
+        from v2m.features.desktop.notification_service import LinuxNotificationService
+
+        service = LinuxNotificationService(config=MockNotificationsConfig(enabled=False))
+        service.notify("titulo", "mensaje")
+
+        assert service.enabled is False
+        mock_run.assert_not_called()
+
     def test_pending_dismissals_property(self):
         """pending_dismissals debe retornar conteo correcto"""
         from v2m.features.desktop.notification_service import LinuxNotificationService
@@ -0,0 +1,40 @@
+"""
+tests unitarios para las utilidades de notificación
+
+valida el comportamiento de notify_safely incluyendo:
+- envío de la notificación cuando están activadas
+- omisión del envío cuando están desactivadas
+- errores del servicio registrados sin propagarse
+"""
+
+from unittest.mock import MagicMock
+
+from v2m.shared.utils.notifications import notify_safely
+
+
+class TestNotifySafely:
+    """tests para notify_safely"""
+
+    async def test_sends_when_enabled(self):
+        """con las notificaciones activadas se delega en el servicio"""
+        service = MagicMock(enabled=True)
+
+        await notify_safely(lambda: service, "título", "mensaje")
+
+        service.notify.assert_called_once_with("título", "mensaje")
+
+    async def test_skips_when_disabled(self):
+        """con las notificaciones desactivadas no se llama a notify"""
+        service = MagicMock(enabled=False)
+
+        await notify_safely(lambda: service, "título", "mensaje")
+
+        service.notify.assert_not_called()
+
+    async def test_service_construction_failure_is_swallowed(self):
+        """un fallo al construir el servicio no se propaga"""
+
+        def broken_service():
+            raise RuntimeError("sin dbus")
+
+        await notify_safely(broken_service, "título", "mensaje")
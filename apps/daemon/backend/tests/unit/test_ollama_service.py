@@ -0,0 +1,86 @@
+"""
+tests unitarios para OllamaLLMService
+
+valida el comportamiento del servicio ollama incluyendo:
+- esquema JSON y mensaje de sistema reutilizados entre peticiones
+- instrucción de traducción cacheada por idioma
+- AsyncClient propio de cada servicio y cerrado en close()
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from v2m.features.llm.ollama_service import OllamaLLMService
+
+
+def _chat_response(content: str) -> MagicMock:
+    """construye una respuesta mock de AsyncClient.chat"""
+    response = MagicMock()
+    response.message.content = content
+    return response
+
+
+@pytest.fixture
+def service() -> OllamaLLMService:
+    """servicio con cliente ollama mockeado"""
+    svc = OllamaLLMService()
+    svc._client = MagicMock()
+    return svc
+
+
+class TestProcessText:
+    """tests para OllamaLLMService.process_text"""
+
+    async def test_reuses_precomputed_schema(self, service):
+        """el esquema JSON se reutiliza entre peticiones en lugar de regenerarse"""
+        service._client.chat = AsyncMock(return_value=_chat_response('{"corrected_text": "hola"}'))
+
+        await service.process_text("hola")
+        await service.process_text("hola")
+
+        first, second = (call.kwargs["format"] for call in service._client.chat.await_args_list)
+        assert first is second
+        assert first["properties"]["corrected_text"]["type"] == "string"
+
+    async def test_reuses_system_message(self, service):
+        """el mensaje de sistema se construye una vez y se pasa por referencia"""
+        service._client.chat = AsyncMock(return_value=_chat_response('{"corrected_text": "hola"}'))
+
+        await service.process_text("hola")
+
+        system_message = service._client.chat.await_args.kwargs["messages"][0]
+        assert system_message is service._system_message
+        assert system_message == {"role": "system", "content": service.system_prompt}
+
+
+class TestTranslateText:
+    """tests para OllamaLLMService.translate_text"""
+
+    async def test_system_message_cached_per_language(self, service):
+        """la instrucción de traducción se reutiliza para el mismo idioma"""
+        service._client.chat = AsyncMock(return_value=_chat_response(" hello "))
+
+        assert await service.translate_text("hola", "en") == "hello"
+        await service.translate_text("adiós", "en")
+        await service.translate_text("adiós", "fr")
+
+        first, second, third = (call.kwargs["messages"][0] for call in service._client.chat.await_args_list)
+        assert first is second
+        assert "'fr'" in third["content"]
+
+
+class TestClientLifecycle:
+    """tests para el AsyncClient propio de cada servicio"""
+
+    def test_each_instance_owns_its_client(self):
+        """cada instancia crea su cliente en lugar de compartir uno global"""
+        assert OllamaLLMService()._client is not OllamaLLMService()._client
+
+    async def test_close_closes_client(self, service):
+        """close() cierra el cliente y su pool de conexiones"""
+        service._client.close = AsyncMock()
+
+        await service.close()
+
+        service._client.close.assert_awaited_once()
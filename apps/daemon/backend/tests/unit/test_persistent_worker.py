@@ -1,5 +1,8 @@
+import asyncio
+import sys
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from v2m.features.transcription.persistent_model import PersistentWhisperWorker
@@ -64,3 +67,142 @@ def test_worker_sync_init(mock_whisper_model):
 
     mock_class.assert_called_once()
     assert worker._model is not None
+
+
+def test_worker_sync_init_runs_warmup_inference(mock_whisper_model):
+    _mock_class, mock_instance = mock_whisper_model
+    mock_instance.transcribe.return_value = (iter([]), None)
+
+    worker = PersistentWhisperWorker(model_size="tiny", keep_warm=True)
+    worker.initialize_sync()
+
+    mock_instance.transcribe.assert_called_once()
+    warmup_audio = mock_instance.transcribe.call_args.args[0]
+    assert warmup_audio.dtype == np.float32
+    assert warmup_audio.shape == (16000,)
+
+
+def test_worker_sync_init_survives_warmup_failure(mock_whisper_model):
+    _mock_class, mock_instance = mock_whisper_model
+    mock_instance.transcribe.side_effect = RuntimeError("cuda error")
+
+    worker = PersistentWhisperWorker(model_size="tiny", keep_warm=True)
+    worker.initialize_sync()
+
+    assert worker._model is mock_instance
+
+
+@pytest.mark.parametrize(
+    ("requested", "expected"),
+    [("int8_float16", "int8"), ("float16", "int8"), ("int8", "int8"), ("float32", "float32")],
+)
+def test_worker_cpu_uses_int8_compute_type(mock_whisper_model, requested, expected):
+    mock_class, _mock_instance = mock_whisper_model
+
+    worker = PersistentWhisperWorker(model_size="tiny", device="cpu", compute_type=requested)
+    worker.initialize_sync()
+
+    assert mock_class.call_args.kwargs["compute_type"] == expected
+
+
+def test_worker_defaults_to_int8_float16_on_cuda():
+    worker = PersistentWhisperWorker(model_size="tiny")
+
+    assert worker.compute_type == "int8_float16"
+
+
+@pytest.mark.asyncio
+async def test_worker_transcribe_returns_materialized_segments(mock_whisper_model):
+    _mock_class, mock_instance = mock_whisper_model
+    mock_instance.transcribe.return_value = (iter(["seg"]), "info")
+
+    worker = PersistentWhisperWorker(model_size="tiny", keep_warm=True)
+    await worker.initialize()
+    segments, _info = await worker.transcribe("audio", language="es")
+
+    mock_instance.transcribe.assert_called_once_with("audio", language="es")
+    assert segments == ["seg"]
+
+
+@pytest.mark.parametrize(
+    ("requested", "language", "expected"),
+    [
+        ("large-v3", "en", "distil-large-v3"),
+        ("large-v3", "es", "large-v3-turbo"),
+        ("large-v3", "auto", "large-v3-turbo"),
+        ("large-v3-turbo", "en", "large-v3-turbo"),
+    ],
+)
+def test_worker_cuda_fallback_downgrades_full_large_model(mock_whisper_model, requested, language, expected):
+    mock_class, _mock_instance = mock_whisper_model
+    fake_torch = MagicMock()
+    fake_torch.cuda.is_available.return_value = False
+
+    with patch.dict(sys.modules, {"torch": fake_torch}):
+        worker = PersistentWhisperWorker(model_size=requested, device="cuda", keep_warm=True, language=language)
+        worker.initialize_sync()
+
+    assert worker.device == "cpu"
+    assert mock_class.call_args.args[0] == expected
+
+
+@pytest.mark.parametrize(
+    ("device", "supported", "expected"),
+    [("cuda", True, True), ("cuda", False, False), ("cpu", True, False)],
+)
+def test_worker_flash_attention_only_on_supported_gpu(mock_whisper_model, device, supported, expected):
+    mock_class, _mock_instance = mock_whisper_model
+
+    with (
+        patch("v2m.features.transcription.persistent_model._supports_flash_attention", return_value=supported),
+        patch.dict(sys.modules, {"torch": None}),
+    ):
+        worker = PersistentWhisperWorker(model_size="tiny", device=device, keep_warm=True, flash_attention=True)
+        worker.initialize_sync()
+
+    assert mock_class.call_args.kwargs["flash_attention"] is expected
+
+
+def test_worker_flash_attention_disabled_by_default(mock_whisper_model):
+    mock_class, _mock_instance = mock_whisper_model
+
+    with (
+        patch("v2m.features.transcription.persistent_model._supports_flash_attention", return_value=True),
+        patch.dict(sys.modules, {"torch": None}),
+    ):
+        worker = PersistentWhisperWorker(model_size="tiny", keep_warm=True)
+        worker.initialize_sync()
+
+    assert mock_class.call_args.kwargs["flash_attention"] is False
+
+
+def test_worker_retries_without_flash_attention_when_unsupported_build(mock_whisper_model):
+    mock_class, mock_instance = mock_whisper_model
+    mock_class.side_effect = [RuntimeError("Flash attention 2 is not supported"), mock_instance]
+
+    with (
+        patch("v2m.features.transcription.persistent_model._supports_flash_attention", return_value=True),
+        patch.dict(sys.modules, {"torch": None}),
+    ):
+        worker = PersistentWhisperWorker(model_size="tiny", keep_warm=True, flash_attention=True)
+        worker.initialize_sync()
+
+    assert worker._model is mock_instance
+    assert mock_class.call_args.kwargs["flash_attention"] is False
+    assert worker.flash_attention is False
+
+
+@pytest.mark.asyncio
+async def test_inference_during_warmup_waits_instead_of_loading_twice(mock_whisper_model):
+    mock_class, mock_instance = mock_whisper_model
+    mock_instance.transcribe.return_value = (iter([]), None)
+
+    worker = PersistentWhisperWorker(model_size="tiny", keep_warm=True)
+    warmup = asyncio.create_task(worker.warmup())
+    await asyncio.sleep(0)  # el warmup toma el lock primero
+
+    result = await worker.run_inference(lambda model: model)
+    await warmup
+
+    mock_class.assert_called_once()
+    assert result is mock_instance
@@ -0,0 +1,180 @@
+"""
+tests unitarios para RecordingWorkflow
+
+valida el comportamiento del workflow de grabación incluyendo:
+- transiciones start/stop atómicas ante toggles concurrentes
+- gestión del flag de grabación fuera del event loop
+- precalentado de servicios durante el warmup
+- respuestas de estado reutilizadas entre consultas
+- detención del grabador aunque fallen el flag o las notificaciones
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from v2m.orchestration.recording_workflow import RecordingWorkflow
+
+
+@pytest.fixture
+def workflow():
+    """workflow con transcriptor, portapapeles y notificaciones mockeados"""
+    wf = RecordingWorkflow()
+    wf._transcriber = MagicMock()
+
+    async def slow_start():
+        await asyncio.sleep(0.01)
+
+    wf._transcriber.start = AsyncMock(side_effect=slow_start)
+    wf._transcriber.stop = AsyncMock(return_value="hola mundo")
+    wf._clipboard = MagicMock()
+    wf._notifications = MagicMock()
+    with patch("v2m.orchestration.recording_workflow.config"):
+        yield wf
+
+
+class TestToggle:
+    """tests para RecordingWorkflow.toggle"""
+
+    async def test_concurrent_toggles_start_then_stop(self, workflow):
+        """dos toggles simultáneos arrancan y detienen en lugar de arrancar dos veces"""
+        first, second = await asyncio.gather(workflow.toggle(), workflow.toggle())
+
+        workflow._transcriber.start.assert_awaited_once()
+        workflow._transcriber.stop.assert_awaited_once()
+        assert first.status == "recording"
+        assert second.status == "idle"
+        assert workflow._is_recording is False
+
+    async def test_concurrent_starts_start_recorder_once(self, workflow):
+        """un segundo start() durante el arranque ve el estado ya actualizado"""
+        first, second = await asyncio.gather(workflow.start(), workflow.start())
+
+        workflow._transcriber.start.assert_awaited_once()
+        assert first.message == "🎙️ Grabando..."
+        assert second.message == "⚠️ Ya está grabando"
+
+
+class TestRecordingFlag:
+    """tests para el flag de grabación en disco"""
+
+    async def test_flag_created_on_start_and_removed_on_stop(self, workflow):
+        """el flag se crea al iniciar y se borra al detener sin fallar si ya no existe"""
+        from v2m.orchestration.recording_workflow import config
+
+        flag = config.paths.recording_flag
+
+        await workflow.start()
+        flag.touch.assert_called_once_with()
+
+        await workflow.stop()
+        flag.unlink.assert_called_once_with(missing_ok=True)
+
+
+class TestWarmup:
+    """tests para RecordingWorkflow.warmup"""
+
+    @pytest.fixture
+    def cold_workflow(self):
+        """workflow sin servicios construidos y con clases pesadas mockeadas"""
+        wf = RecordingWorkflow()
+        wf._worker = MagicMock()
+        wf._worker.warmup = AsyncMock()
+        with (
+            patch("v2m.features.audio.streaming_transcriber.StreamingTranscriber") as transcriber_cls,
+            patch("v2m.features.audio.recorder.AudioRecorder"),
+            patch("v2m.features.desktop.linux_adapters.LinuxClipboardAdapter") as clipboard_cls,
+            patch("v2m.features.desktop.notification_service.LinuxNotificationService") as notifications_cls,
+        ):
+            yield wf, transcriber_cls, clipboard_cls, notifications_cls
+
+    async def test_warmup_builds_services_alongside_model(self, cold_workflow):
+        """el warmup deja construidos transcriptor, portapapeles y notificaciones"""
+        wf, transcriber_cls, clipboard_cls, notifications_cls = cold_workflow
+
+        await wf.warmup()
+
+        wf._worker.warmup.assert_awaited_once()
+        assert wf._model_loaded is True
+        assert wf._transcriber is transcriber_cls.return_value
+        assert wf._clipboard is clipboard_cls.return_value
+        assert wf._notifications is notifications_cls.return_value
+
+    async def test_service_failure_does_not_block_model_warmup(self, cold_workflow):
+        """si un servicio falla al construirse el modelo igualmente queda cargado"""
+        wf, transcriber_cls, clipboard_cls, _notifications_cls = cold_workflow
+        clipboard_cls.side_effect = RuntimeError("sin portapapeles")
+
+        await wf.warmup()
+
+        assert wf._model_loaded is True
+        assert wf._clipboard is None
+        assert wf._transcriber is transcriber_cls.return_value
+
+    async def test_import_failure_is_logged_not_raised(self, cold_workflow):
+        """si el import del modelo falla el warmup lo registra sin propagar la excepción"""
+        wf, *_ = cold_workflow
+
+        # el logger se parchea primero: patch() resuelve sus destinos con import_module
+        with (
+            patch("v2m.orchestration.recording_workflow.logger") as mock_logger,
+            patch(
+                "v2m.orchestration.recording_workflow.importlib.import_module",
+                side_effect=ImportError("ctranslate2"),
+            ),
+        ):
+            await wf.warmup()
+
+        assert wf._model_loaded is False
+        wf._worker.warmup.assert_not_called()
+        mock_logger.error.assert_called_once()
+
+
+class TestGetStatus:
+    """tests para RecordingWorkflow.get_status"""
+
+    def test_status_reused_for_same_state(self, workflow):
+        """el mismo estado devuelve la misma instancia inmutable"""
+        first = workflow.get_status()
+
+        assert workflow.get_status() is first
+        assert first.state == "idle"
+        assert first.recording is False
+
+    async def test_status_reflects_recording(self, workflow):
+        """al grabar el estado cambia a recording"""
+        await workflow.start()
+
+        status = workflow.get_status()
+
+        assert status.state == "recording"
+        assert status.recording is True
+
+
+class TestStop:
+    """tests para RecordingWorkflow.stop ante fallos parciales"""
+
+    async def test_flag_unlink_failure_still_stops_recorder(self, workflow):
+        """si no se puede borrar el flag el grabador se detiene igualmente"""
+        from v2m.orchestration.recording_workflow import config
+
+        await workflow.start()
+        config.paths.recording_flag.unlink.side_effect = PermissionError("read-only")
+
+        response = await workflow.stop()
+
+        workflow._transcriber.stop.assert_awaited_once()
+        assert response.text == "hola mundo"
+        assert workflow._is_recording is False
+
+    async def test_notification_failure_still_stops_recorder(self, workflow):
+        """un fallo de notificación no deja el micrófono abierto"""
+        await workflow.start()
+        workflow._notifications.notify.side_effect = RuntimeError("dbus caído")
+
+        response = await workflow.stop()
+
+        workflow._transcriber.stop.assert_awaited_once()
+        workflow._clipboard.copy.assert_called_once_with("hola mundo")
+        assert response.status == "idle"
@@ -27,14 +27,17 @@ def _generate_silence_chunk(duration_samples: int = 16000) -> np.ndarray:
     return np.zeros(duration_samples, dtype=np.float32)
 
 
+# Shared 100ms silence chunk (read-only: the transcriber copies audio when accumulating)
+_SILENCE_CHUNK_100MS = _generate_silence_chunk(1600)
+_SILENCE_CHUNK_100MS.setflags(write=False)
+
+
 @pytest.fixture
 def mock_worker():
     worker = AsyncMock()
 
-    async def fake_inference(func):
-        segment = MagicMock()
-        segment.text = " hello world"
-        return [segment]
+    async def fake_inference(func, *args, **kwargs):
+        return "hello world"
 
     worker.run_inference = fake_inference
     return worker
@@ -82,7 +85,7 @@ def mock_recorder_speech_then_silence():
     # 1 second speech (10 chunks * 100ms each)
     speech = [_generate_speech_chunk(1600) for _ in range(10)]
     # 1.5 second silence (15 chunks * 100ms each) - triggers commit at 1000ms
-    silence = [_generate_silence_chunk(1600) for _ in range(15)]
+    silence = [_SILENCE_CHUNK_100MS] * 15
     return create_mock_recorder(speech + silence, delay_ms=5)
 
 
@@ -121,10 +124,8 @@ async def test_streaming_emits_partials(mock_worker, mock_session, mock_recorder
     """Test that provisional (partial) transcriptions are emitted during speech."""
     streamer = StreamingTranscriber(mock_worker, mock_session, mock_recorder_speech)
 
-    async def fake_infer(func):
-        seg = MagicMock()
-        seg.text = " hello"
-        return [seg]
+    async def fake_infer(func, *args, **kwargs):
+        return "hello"
 
     mock_worker.run_inference = fake_infer
 
@@ -224,13 +225,11 @@ async def test_queue_backpressure(mock_worker, mock_session):
     # Slow inference to simulate backpressure
     call_count = 0
 
-    async def slow_inference(func):
+    async def slow_inference(func, *args, **kwargs):
         nonlocal call_count
         call_count += 1
         await asyncio.sleep(0.1)  # Simulate slow Whisper
-        segment = MagicMock()
-        segment.text = f" chunk{call_count}"
-        return [segment]
+        return f"chunk{call_count}"
 
     mock_worker.run_inference = slow_inference
 
@@ -259,12 +258,10 @@ async def test_producer_consumer_isolation(mock_worker, mock_session):
     inference_started = asyncio.Event()
     inference_can_continue = asyncio.Event()
 
-    async def blocking_inference(func):
+    async def blocking_inference(func, *args, **kwargs):
         inference_started.set()
         await inference_can_continue.wait()  # Block until signaled
-        segment = MagicMock()
-        segment.text = " test"
-        return [segment]
+        return "test"
 
     mock_worker.run_inference = blocking_inference
 
@@ -291,3 +288,141 @@ async def test_producer_consumer_isolation(mock_worker, mock_session):
     # Producer filled queue independently of Consumer state
     # (exact assertion depends on timing, but architecture is validated)
 
+
+
+def test_run_whisper_forwards_audio_and_params():
+    """_run_whisper is a static entrypoint: audio and params travel as arguments."""
+    audio = _generate_silence_chunk(1600)
+    model = MagicMock()
+    model.transcribe.return_value = (iter([]), None)
+
+    StreamingTranscriber._run_whisper(model, audio, {"beam_size": 1, "task": "transcribe"}, "contexto")
+
+    model.transcribe.assert_called_once_with(audio, initial_prompt="contexto", beam_size=1, task="transcribe")
+
+
+@pytest.mark.asyncio
+async def test_transcribe_audio_passes_precomputed_params_by_reference(mock_worker, mock_session):
+    """The frozen per-mode kwargs reach the worker untouched; only the prompt varies."""
+    streamer = StreamingTranscriber(mock_worker, mock_session, MagicMock())
+    streamer._context_window = "hola"
+    mock_worker.run_inference = AsyncMock(return_value="ok")
+    audio = _generate_speech_chunk(1600)
+
+    await streamer._infer_final(audio)
+
+    func, sent_audio, params, prompt = mock_worker.run_inference.await_args.args
+    assert func is StreamingTranscriber._run_whisper
+    assert sent_audio is audio
+    assert params is streamer._final_params
+    assert prompt == "hola"
+
+
+def test_run_whisper_joins_segments_in_worker_thread():
+    """Segments are consumed lazily and joined into text, skipping empty ones."""
+    segments = []
+    for text in (" hola ", "", " mundo"):
+        seg = MagicMock()
+        seg.text = text
+        segments.append(seg)
+    model = MagicMock()
+    model.transcribe.return_value = ((s for s in segments), None)
+
+    result = StreamingTranscriber._run_whisper(model, _generate_silence_chunk(1600), {})
+
+    assert result == "hola mundo"
+
+
+@pytest.mark.parametrize(
+    ("amplitude", "expected"),
+    [(0.0, False), (0.01, False), (0.02, True), (0.5, True)],
+)
+def test_detect_speech_energy_matches_rms_threshold(mock_worker, mock_session, amplitude, expected):
+    """Energy fallback keeps RMS > threshold semantics (constant signal: RMS == amplitude)."""
+    streamer = StreamingTranscriber(mock_worker, mock_session, MagicMock())
+    chunk = np.full(1600, amplitude, dtype=np.float32)
+
+    assert streamer._detect_speech_energy(chunk) is expected
+    assert streamer._detect_speech_energy(np.array([], dtype=np.float32)) is False
+
+
+def test_segment_buffer_appends_and_grows(mock_worker, mock_session):
+    """Chunks are copied into the preallocated buffer, which grows past its capacity."""
+    streamer = StreamingTranscriber(mock_worker, mock_session, MagicMock())
+    capacity = len(streamer._segment_buffer)
+    first = np.full(capacity - 10, 0.25, dtype=np.float32)
+    second = np.full(100, 0.5, dtype=np.float32)
+
+    streamer._append_to_segment(first)
+    streamer._append_to_segment(second)
+
+    audio = streamer._segment_audio()
+    assert len(streamer._segment_buffer) >= capacity + 90
+    np.testing.assert_array_equal(audio, np.concatenate([first, second]))
+    assert np.shares_memory(audio, streamer._segment_buffer)
+
+
+@pytest.mark.asyncio
+async def test_new_session_does_not_overwrite_previous_segment(mock_worker, mock_session):
+    """A view handed to a still-queued job survives start() of the next session."""
+    streamer = StreamingTranscriber(mock_worker, mock_session, create_mock_recorder([]))
+    streamer._append_to_segment(np.full(1600, 0.25, dtype=np.float32))
+    pending = streamer._segment_audio()
+
+    await streamer.start()
+    streamer._append_to_segment(np.full(1600, 0.5, dtype=np.float32))
+    await streamer.stop()
+
+    assert not np.shares_memory(pending, streamer._segment_buffer)
+    np.testing.assert_array_equal(pending, np.full(1600, 0.25, dtype=np.float32))
+
+
+def test_silero_receives_fixed_512_sample_frames(mock_worker, mock_session, monkeypatch):
+    """Arbitrary recorder chunks are framed to 512 samples, carrying the remainder over."""
+    import types
+
+    from v2m.features.audio import streaming_transcriber as module
+
+    # torch.from_numpy stand-in: numpy arrays already support reshape/iteration
+    monkeypatch.setattr(module, "torch", types.SimpleNamespace(from_numpy=lambda a: a))
+
+    frame_sizes = []
+
+    def fake_vad(frame, sr):
+        frame_sizes.append(len(frame))
+        return 0.9 if frame.max() > 0 else 0.1
+
+    streamer = StreamingTranscriber(mock_worker, mock_session, MagicMock())
+    streamer._vad_model = fake_vad
+
+    assert streamer._detect_speech_silero(_generate_silence_chunk(1000)) is False  # 1 frame, 488 left
+    assert streamer._detect_speech_silero(np.full(600, 0.5, dtype=np.float32)) is True  # 488 + 600 -> 2 frames
+
+    assert frame_sizes == [512, 512, 512]
+    assert len(streamer._vad_residual) == (1000 + 600) - 3 * 512
+
+
+def test_context_window_is_stored_trimmed(mock_worker, mock_session):
+    """The window is kept at CONTEXT_WINDOW_CHARS and has no leading separator."""
+    from v2m.features.audio.streaming_transcriber import CONTEXT_WINDOW_CHARS
+
+    streamer = StreamingTranscriber(mock_worker, mock_session, MagicMock())
+
+    streamer._update_context_window("  hola  ")
+    assert streamer._context_window == "hola"
+
+    streamer._update_context_window("x" * (CONTEXT_WINDOW_CHARS + 50))
+    assert len(streamer._context_window) == CONTEXT_WINDOW_CHARS
+
+
+@pytest.mark.asyncio
+async def test_dead_air_segment_skips_whisper(mock_worker, mock_session):
+    """Digital silence never reaches the encoder; real audio still does."""
+    streamer = StreamingTranscriber(mock_worker, mock_session, MagicMock())
+    mock_worker.run_inference = AsyncMock(return_value="hola")
+
+    assert await streamer._infer_final(_generate_silence_chunk(16000)) == ""
+    mock_worker.run_inference.assert_not_awaited()
+
+    assert await streamer._infer_final(_generate_speech_chunk(16000)) == "hola"
+    mock_worker.run_inference.assert_awaited_once()
@@ -0,0 +1,23 @@
+"""
+tests unitarios para las utilidades de texto
+
+valida el recorte de textos para notificaciones
+"""
+
+from v2m.shared.utils.text import ELLIPSIS, preview
+
+
+class TestPreview:
+    """tests para preview"""
+
+    def test_short_text_returned_unchanged(self):
+        """un texto que cabe se devuelve tal cual, sin sufijo"""
+        text = "hola mundo"
+
+        assert preview(text) is text
+
+    def test_long_text_truncated_with_ellipsis(self):
+        """un texto largo se recorta al límite y termina en elipsis"""
+        result = preview("a" * 100, limit=80)
+
+        assert result == "a" * 80 + ELLIPSIS